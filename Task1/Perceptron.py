@@ -1,11 +1,12 @@
 import numpy as np
 
 class Perceptron:
-    def __init__(self, lr=0.1, epochs=100):
+    def __init__(self, lr=0.1, epochs=100, input_size=2):
         self.lr = lr  # learning rate
         self.epochs = epochs  # počet epoch
-        self.weights = np.random.randn(2)  # váhy (pro x a y)
+        self.weights = None if input_size is None else np.random.randn(input_size)  # váhy (pro každou dimenzi vstupu)
         self.bias = np.random.randn()  # bias
+        self.epochs_trained = 0  # počet skutečně proběhlých epoch
 
     # signum activation function
     def signum(self, x):
@@ -13,13 +14,46 @@ class Perceptron:
 
 
     def predict(self, x):
-        linear_output = np.dot(self.weights, x) + self.bias
+        # x může být jeden bod (d,) nebo celá matice bodů (N, d)
+        linear_output = np.dot(x, self.weights) + self.bias
         return self.signum(linear_output)
 
-    def train(self, X, y):
+    def partial_fit(self, X, y):
+        """
+        Jedna aktualizace vah z jednoho chunku dat, chunk musí být v paměti
+        :param X: matice vstupů (N, d), při input_size=None se podle ní vytvoří váhy
+        :param y: labely (N,)
+        :return: počet chybně klasifikovaných bodů v chunku (před aktualizací)
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y)
+        if self.weights is None:
+            self.weights = np.random.randn(X.shape[1])
+
+        error = y - self.predict(X)
+        self.weights += self.lr * np.dot(error, X)  # aktualizace vah
+        self.bias += self.lr * np.sum(error)  # aktualizace biasu
+        return np.count_nonzero(error)
+
+    def train(self, X, y, batch_size=1):
+        """
+        Trénování po mini-dávkách - predikce i aktualizace vah se počítají pro celou dávku najednou
+        :param X: matice vstupů (N, d)
+        :param y: labely (N,)
+        :param batch_size: velikost mini-dávky, 1 = původní trénování po bodech (výchozí),
+                           větší dávka nebo None = celá epocha najednou je rychlejší, ale hůř konverguje
+        :return:
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y)
+        batch_size = batch_size or len(X)
+
+        self.epochs_trained = 0
         for _ in range(self.epochs):
-            for i in range(len(X)):
-                prediction = self.predict(X[i])
-                error = y[i] - prediction
-                self.weights += self.lr * error * X[i]  # aktualizace vah
-                self.bias += self.lr * error  # aktualizace biasu
\ No newline at end of file
+            mistakes = 0
+            for start in range(0, len(X), batch_size):
+                mistakes += self.partial_fit(X[start:start + batch_size], y[start:start + batch_size])
+            self.epochs_trained += 1
+
+            if mistakes == 0:  # epocha bez chyby, dál není co učit
+                break
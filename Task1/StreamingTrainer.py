@@ -0,0 +1,95 @@
+import argparse
+import time
+
+import numpy as np
+
+from Perceptron import Perceptron
+
+
+class StreamingTrainer:
+    """
+    Trénování modelu s partial_fit po chuncích z memory-mapped souborů,
+    v paměti je vždy jen jeden chunk dat
+    """
+
+    def __init__(self, model, chunk_size=100000, verbose=True):
+        self.model = model
+        self.chunk_size = chunk_size
+        self.verbose = verbose
+        self.history = []  # záznam pro každý zpracovaný chunk
+
+    @staticmethod
+    def open_array(path, dtype=None, n_features=None):
+        """
+        Otevře pole bez načtení do paměti
+        :param path: .npy soubor nebo raw binární soubor pro np.memmap
+        :param dtype: datový typ raw souboru
+        :param n_features: počet sloupců raw souboru, None = 1D pole
+        :return:
+        """
+        if str(path).endswith(".npy"):
+            return np.load(path, mmap_mode="r")
+        data = np.memmap(path, dtype=dtype, mode="r")
+        return data if n_features is None else data.reshape(-1, n_features)
+
+    def fit_files(self, X_path, y_path, epochs=1, dtype=np.float64, n_features=None):
+        X = self.open_array(X_path, dtype, n_features)
+        y = self.open_array(y_path, dtype)
+        return self.fit(X, y, epochs)
+
+    def fit(self, X, y, epochs=1):
+        """
+        :param X: matice vstupů, typicky np.memmap (N, d)
+        :param y: labely (N,)
+        :param epochs: maximální počet průchodů přes data, končí dřív po průchodu bez chyby
+        :return: historie chunků
+        """
+        for epoch in range(epochs):
+            mistakes = 0
+            for start in range(0, len(X), self.chunk_size):
+                started = time.perf_counter()
+                # np.asarray načte z disku jen tento chunk
+                X_chunk = np.asarray(X[start:start + self.chunk_size], dtype=float)
+                y_chunk = np.asarray(y[start:start + self.chunk_size])
+                chunk_mistakes = self.model.partial_fit(X_chunk, y_chunk)
+                elapsed = time.perf_counter() - started
+
+                mistakes += chunk_mistakes
+                record = {
+                    "epoch": epoch,
+                    "start": start,
+                    "samples": len(X_chunk),
+                    "mistakes": int(chunk_mistakes),
+                    "seconds": elapsed,
+                    "samples_per_s": len(X_chunk) / elapsed if elapsed > 0 else float("inf"),
+                }
+                self.history.append(record)
+                if self.verbose:
+                    print(f"Epoch {epoch}, chunk {start}-{start + len(X_chunk)}: "
+                          f"{record['samples_per_s']:.0f} samples/s, mistakes: {record['mistakes']}")
+
+            if mistakes == 0:
+                break
+        return self.history
+
+    def throughput(self):
+        # celková propustnost přes všechny chunky
+        samples = sum(record["samples"] for record in self.history)
+        seconds = sum(record["seconds"] for record in self.history)
+        return samples / seconds if seconds > 0 else float("inf")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streamované trénování perceptronu z .npy / raw memmap souborů")
+    parser.add_argument("X", help="soubor se vstupy (N, d)")
+    parser.add_argument("y", help="soubor s labely (N,)")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--lr", type=float, default=0.1)
+    parser.add_argument("--dtype", default="float64", help="dtype raw memmap souborů")
+    parser.add_argument("--features", type=int, default=None, help="počet sloupců raw memmap souboru X")
+    args = parser.parse_args()
+
+    trainer = StreamingTrainer(Perceptron(lr=args.lr, input_size=None), chunk_size=args.chunk_size)
+    trainer.fit_files(args.X, args.y, epochs=args.epochs, dtype=np.dtype(args.dtype), n_features=args.features)
+    print(f"Throughput: {trainer.throughput():.0f} samples/s")
@@ -19,7 +19,7 @@ perceptron = Perceptron()
 perceptron.train(X_train, y_train)
 
 # Predikce
-labels = np.array([perceptron.predict([x[i], y[i]]) for i in range(len(x))])
+labels = perceptron.predict(X_train)
 
 colors = {1: 'blue', -1: 'red'}
 
@@ -0,0 +1,127 @@
+import json
+
+import numpy as np
+
+from Task1.Perceptron import Perceptron
+from Neuron import Neuron
+from NeuralNetwork import NeuralNetwork
+
+# Formát souboru:
+#   MAGIC | délka manifestu (uint64 little-endian) | JSON manifest | zarovnaná data polí
+# Každé pole začíná na offsetu zarovnaném na ALIGNMENT bajtů, takže ho jde přímo
+# namapovat pomocí np.memmap a sdílet mezi procesy jednu read-only kopii.
+MAGIC = b"NAVYCKPT"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def save_checkpoint(path, kind, params, arrays):
+    """
+    :param path: cílový soubor
+    :param kind: typ modelu (název třídy)
+    :param params: hyperparametry, musí jít uložit do JSON
+    :param arrays: slovník název -> numpy pole
+    :return:
+    """
+    arrays = {name: np.asarray(array) for name, array in arrays.items()}  # tofile zapisuje vždy v C pořadí
+    entries = [{"name": name, "dtype": array.dtype.str, "shape": list(array.shape), "offset": 0}
+               for name, array in arrays.items()]
+
+    # offsety závisí na délce manifestu a délka manifestu na offsetech - ustálí se po pár průchodech
+    manifest = {}
+    header_size = 0
+    while True:
+        offset = _align(len(MAGIC) + 8 + header_size)
+        for entry in entries:
+            entry["offset"] = offset
+            offset = _align(offset + arrays[entry["name"]].nbytes)
+        manifest = {"format": FORMAT_VERSION, "kind": kind, "params": params, "arrays": entries}
+        encoded = json.dumps(manifest).encode("utf-8")
+        if len(encoded) == header_size:
+            break
+        header_size = len(encoded)
+
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(np.array(header_size, dtype="<u8").tobytes())
+        file.write(encoded)
+        for entry in entries:
+            file.write(b"\0" * (entry["offset"] - file.tell()))
+            arrays[entry["name"]].tofile(file)
+
+
+def read_checkpoint(path, mmap_mode=None):
+    """
+    :param path: soubor s checkpointem
+    :param mmap_mode: None = načíst do paměti, 'r' = sdílený read-only memmap, 'c' = copy-on-write memmap
+    :return: manifest a slovník polí
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a checkpoint file")
+        header_size = int(np.frombuffer(file.read(8), dtype="<u8")[0])
+        manifest = json.loads(file.read(header_size).decode("utf-8"))
+        if manifest["format"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported checkpoint format: {manifest['format']}")
+
+        arrays = {}
+        for entry in manifest["arrays"]:
+            dtype = np.dtype(entry["dtype"])
+            shape = tuple(entry["shape"])
+            if mmap_mode is None or not shape:
+                file.seek(entry["offset"])
+                arrays[entry["name"]] = np.fromfile(file, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+            else:
+                arrays[entry["name"]] = np.memmap(path, dtype=dtype, mode=mmap_mode,
+                                                  offset=entry["offset"], shape=shape)
+    return manifest, arrays
+
+
+def save_model(model, path):
+    if isinstance(model, NeuralNetwork):
+        sizes = [model.layers[0].input_size] + [layer.output_size for layer in model.layers]
+        arrays = {}
+        for i, layer in enumerate(model.layers):
+            arrays[f"layer{i}.weights"] = layer.weights
+            arrays[f"layer{i}.bias"] = layer.bias
+        save_checkpoint(path, "NeuralNetwork", {"sizes": sizes, "lr": model.lr, "epochs": model.epochs}, arrays)
+    elif isinstance(model, Perceptron):
+        # Neuron je podtřída Perceptronu a ukládá se stejně
+        kind = "Neuron" if isinstance(model, Neuron) else "Perceptron"
+        params = {"input_size": len(model.weights), "lr": model.lr, "epochs": model.epochs}
+        save_checkpoint(path, kind, params, {"weights": model.weights, "bias": np.asarray(model.bias)})
+    else:
+        raise TypeError(f"Unsupported model type: {type(model).__name__}")
+
+
+def load_model(path, mmap_mode=None):
+    """
+    :param path: soubor s checkpointem
+    :param mmap_mode: viz read_checkpoint, s 'r' jsou váhy jen pro čtení (inference), s 'c' lze dál trénovat
+    :return: Perceptron, Neuron nebo NeuralNetwork
+    """
+    manifest, arrays = read_checkpoint(path, mmap_mode)
+    kind = manifest["kind"]
+    params = manifest["params"]
+
+    if kind == "NeuralNetwork":
+        sizes = params["sizes"]
+        model = NeuralNetwork(sizes[0], sizes[1:-1], sizes[-1], params["lr"], params["epochs"])
+        for i, layer in enumerate(model.layers):
+            layer.weights = arrays[f"layer{i}.weights"]
+            layer.bias = arrays[f"layer{i}.bias"]
+    elif kind == "Neuron":
+        model = Neuron(params["input_size"], params["lr"], params["epochs"])
+        model.weights = arrays["weights"]
+        model.bias = float(arrays["bias"])
+    elif kind == "Perceptron":
+        model = Perceptron(params["lr"], params["epochs"], params["input_size"])
+        model.weights = arrays["weights"]
+        model.bias = float(arrays["bias"])
+    else:
+        raise ValueError(f"Unknown model kind: {kind}")
+    return model
@@ -0,0 +1,103 @@
+import numpy as np
+
+
+class DenseLayer:
+    """
+    Plně propojená vrstva se sigmoidou - jedna matice vah (výstupy, vstupy) a jeden vektor biasů
+    """
+
+    def __init__(self, input_size, output_size):
+        self.weights = np.random.randn(output_size, input_size)  # řádek j = váhy j-tého neuronu
+        self.bias = np.random.randn(output_size)
+
+    @property
+    def input_size(self):
+        return self.weights.shape[1]
+
+    @property
+    def output_size(self):
+        return self.weights.shape[0]
+
+    def sigmoid(self, x):
+        return 1 / (1 + np.exp(-x))
+
+    def sigmoid_derivative(self, x):
+        return x * (1 - x)
+
+    def forward(self, X):
+        # X je jeden vstup (d,) nebo dávka (N, d)
+        return self.sigmoid(np.dot(X, self.weights.T) + self.bias)
+
+    def backward(self, X, output, delta_in, lr):
+        """
+        Zpětný průchod pro celou dávku
+        :param X: vstupy vrstvy (N, d)
+        :param output: výstupy vrstvy z dopředného průchodu (N, k)
+        :param delta_in: chyba na výstupu vrstvy (N, k)
+        :param lr: learning rate
+        :return: chyba pro předchozí vrstvu (N, d)
+        """
+        delta = delta_in * self.sigmoid_derivative(output)
+        delta_out = np.dot(delta, self.weights)  # počítá se ještě s původními vahami
+        self.weights += lr * np.dot(delta.T, X)
+        self.bias += lr * np.sum(delta, axis=0)
+        return delta_out
+
+    def neurons(self, network=None):
+        """
+        :param network: síť, ze které neurony čtou lr a epochs
+        """
+        return [LayerNeuron(self, j, network) for j in range(self.output_size)]
+
+
+class LayerNeuron:
+    """
+    Pohled na jeden neuron vrstvy se stejným API jako Neuron, váhy sdílí s maticí vrstvy
+    """
+
+    def __init__(self, layer, index, network=None):
+        self.layer = layer
+        self.index = index
+        self.network = network
+
+    @property
+    def lr(self):
+        return self.network.lr if self.network is not None else None
+
+    @lr.setter
+    def lr(self, value):
+        self.network.lr = value
+
+    @property
+    def epochs(self):
+        return self.network.epochs if self.network is not None else None
+
+    @epochs.setter
+    def epochs(self, value):
+        self.network.epochs = value
+
+    @property
+    def weights(self):
+        return self.layer.weights[self.index]
+
+    @weights.setter
+    def weights(self, value):
+        self.layer.weights[self.index] = value
+
+    @property
+    def bias(self):
+        return self.layer.bias[self.index]
+
+    @bias.setter
+    def bias(self, value):
+        self.layer.bias[self.index] = value
+
+    def sigmoid(self, x):
+        return self.layer.sigmoid(x)
+
+    def sigmoid_derivative(self, x):
+        return self.layer.sigmoid_derivative(x)
+
+    def predict(self, x):
+        linear_output = np.dot(x, self.weights) + self.bias
+        return self.sigmoid(linear_output)
@@ -0,0 +1,110 @@
+import time
+
+import numpy as np
+
+from NeuralNetwork import NeuralNetwork
+
+
+class EnsembleTrainer:
+    """
+    Trénování K malých sítí najednou - váhy všech členů jsou naskládané do 3D tenzorů (K, výstupy, vstupy)
+    a každá epocha je jeden dávkový výpočet přes všechny členy a všechny vzory
+    """
+
+    def __init__(self, n_members, input_size, hidden_size, output_size, lr=0.1, epochs=10000, seed=None):
+        self.n_members = n_members
+        self.lr = lr
+        self.epochs = epochs
+        rng = np.random.default_rng(seed)
+        hidden_sizes = list(hidden_size) if isinstance(hidden_size, (list, tuple)) else [hidden_size]
+        sizes = [input_size] + hidden_sizes + [output_size]
+        self.weights = [rng.standard_normal((n_members, sizes[i + 1], sizes[i])) for i in range(len(sizes) - 1)]
+        self.biases = [rng.standard_normal((n_members, sizes[i + 1])) for i in range(len(sizes) - 1)]
+
+        self.convergence_epoch = np.full(n_members, -1)  # první epocha se všemi správnými výstupy, -1 = nikdy
+        self.final_loss = np.full(n_members, np.nan)
+        self.train_time = 0.0
+        self.epochs_run = 0  # epochy s aktualizací vah v posledním trénování
+
+    def sigmoid(self, x):
+        return 1 / (1 + np.exp(-x))
+
+    def sigmoid_derivative(self, x):
+        return x * (1 - x)
+
+    def forward_all(self, X):
+        # X (N, d) se broadcastuje na všechny členy, výstupy vrstev mají tvar (K, N, k)
+        activations = [X]
+        for W, b in zip(self.weights, self.biases):
+            activations.append(self.sigmoid(np.matmul(activations[-1], W.transpose(0, 2, 1)) + b[:, None, :]))
+        return activations
+
+    def predict(self, X):
+        return self.forward_all(np.asarray(X, dtype=float))[-1]
+
+    def train(self, X, y, stop_when_converged=False):
+        """
+        Dávkové trénování všech členů, jedna epocha = jeden krok přes celý dataset
+        :param X: vstupy (N, d)
+        :param y: očekávané výstupy (N,) nebo (N, k)
+        :param stop_when_converged: skončit, jakmile zkonvergují všichni členové
+        :return: (epocha konvergence, finální loss) pro každého člena
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float).reshape(len(X), -1)
+
+        self.epochs_run = 0
+        start = time.perf_counter()
+        for epoch in range(self.epochs):
+            activations = self.forward_all(X)
+            output_error = y - activations[-1]
+
+            # konvergence = všechny zaokrouhlené výstupy správně
+            correct = np.all(np.round(activations[-1]) == y, axis=(1, 2))
+            newly_converged = correct & (self.convergence_epoch < 0)
+            self.convergence_epoch[newly_converged] = epoch
+            if stop_when_converged and np.all(self.convergence_epoch >= 0):
+                break
+
+            delta = output_error
+            for i in reversed(range(len(self.weights))):
+                delta = delta * self.sigmoid_derivative(activations[i + 1])
+                delta_out = np.matmul(delta, self.weights[i])
+                self.weights[i] += self.lr * np.matmul(delta.transpose(0, 2, 1), activations[i])
+                self.biases[i] += self.lr * np.sum(delta, axis=1)
+                delta = delta_out
+            self.epochs_run += 1
+        self.train_time = time.perf_counter() - start
+
+        self.final_loss = np.mean((y - self.predict(X)) ** 2, axis=(1, 2))
+        return self.convergence_epoch, self.final_loss
+
+    def member(self, k):
+        # k-tý člen jako samostatná NeuralNetwork
+        sizes = [self.weights[0].shape[2]] + [W.shape[1] for W in self.weights]
+        nn = NeuralNetwork(sizes[0], sizes[1:-1], sizes[-1], self.lr, self.epochs)
+        for layer, W, b in zip(nn.layers, self.weights, self.biases):
+            layer.weights = W[k].copy()
+            layer.bias = b[k].copy()
+        return nn
+
+    def report(self):
+        converged = self.convergence_epoch >= 0
+        print(f"Members: {self.n_members}, converged: {np.count_nonzero(converged)}")
+        if converged.any():
+            print(f"Convergence epoch - median: {np.median(self.convergence_epoch[converged]):.0f}, "
+                  f"max: {np.max(self.convergence_epoch[converged])}")
+        print(f"Final loss - mean: {np.mean(self.final_loss):.5f}, max: {np.max(self.final_loss):.5f}")
+        if self.train_time > 0:
+            print(f"Throughput: {self.n_members * self.epochs_run / self.train_time:.0f} member-epochs/s "
+                  f"({self.epochs_run} epochs)")
+
+
+if __name__ == "__main__":
+    X = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+    y = np.array([0, 1, 1, 0])
+
+    for n_members in [1, 10, 100, 1000]:
+        ensemble = EnsembleTrainer(n_members, 2, 2, 1, lr=0.5, epochs=5000, seed=0)
+        ensemble.train(X, y)
+        ensemble.report()
@@ -0,0 +1,193 @@
+import argparse
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from Task1.Perceptron import Perceptron
+from Neuron import Neuron
+
+COLUMNS = ["trial", "model", "lr", "epochs", "seed", "accuracy", "wall_time", "epochs_to_converge", "status"]
+
+
+def make_dataset(n_samples, seed, a=0.5, b=2):
+    # stejná úloha jako v Task1 - body nad / pod přímkou y = ax + b
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(-10, 10, (n_samples, 2))
+    y = np.where(X[:, 1] > (a * X[:, 0] + b), 1, -1)
+    return X, y
+
+
+def build_model(model_name, lr, epochs):
+    if model_name == "perceptron":
+        return Perceptron(lr, epochs)
+    if model_name == "neuron":
+        return Neuron(2, lr, epochs)
+    raise ValueError(f"Unknown model: {model_name}")
+
+
+def classify(model_name, model, X):
+    # neuron má sigmoid výstup a labely 0/1, perceptron signum a labely -1/1
+    if model_name == "neuron":
+        return (model.predict(X) >= 0.5).astype(int)
+    return model.predict(X)
+
+
+def grid_search(space):
+    """
+    :param space: slovník parametr -> seznam hodnot
+    :return: všechny kombinace parametrů
+    """
+    keys = list(space)
+    return [dict(zip(keys, values)) for values in itertools.product(*(space[key] for key in keys))]
+
+
+def random_search(space, n_trials, seed=0):
+    """
+    :param space: slovník parametr -> seznam hodnot (výběr) nebo dvojice (low, high) (rovnoměrně)
+    :param n_trials: počet náhodných konfigurací
+    :param seed: seed pro výběr konfigurací
+    :return:
+    """
+    rng = np.random.default_rng(seed)
+    trials = []
+    for _ in range(n_trials):
+        params = {}
+        for key, values in space.items():
+            if isinstance(values, tuple):
+                low, high = values
+                if isinstance(low, int) and isinstance(high, int):
+                    params[key] = int(rng.integers(low, high + 1))
+                else:
+                    params[key] = float(rng.uniform(low, high))
+            else:
+                params[key] = values[rng.integers(len(values))]
+        trials.append(params)
+    return trials
+
+
+def run_trial(trial, model_name, params, seed, time_budget, n_samples, data_seed):
+    """
+    Jeden běh trénování, spouští se ve worker procesu
+    :return: řádek výsledkové tabulky
+    """
+    np.random.seed(seed)  # inicializace vah modelu používá globální np.random
+    X, y = make_dataset(n_samples, data_seed)
+    if model_name == "neuron":
+        y = (y + 1) // 2
+
+    model = build_model(model_name, params["lr"], params["epochs"])
+    status = "max_epochs"
+    epochs_to_converge = None
+    accuracy = 0.0
+
+    start = time.perf_counter()
+    for epoch in range(params["epochs"]):
+        model.partial_fit(X, y)
+        accuracy = float(np.mean(classify(model_name, model, X) == y))
+        if accuracy == 1.0:
+            status = "converged"
+            epochs_to_converge = epoch + 1
+            break
+        if time.perf_counter() - start > time_budget:  # pomalá konfigurace, ukončit
+            status = "timeout"
+            break
+
+    return {
+        "trial": trial,
+        "model": model_name,
+        "lr": params["lr"],
+        "epochs": params["epochs"],
+        "seed": seed,
+        "accuracy": accuracy,
+        "wall_time": time.perf_counter() - start,
+        "epochs_to_converge": epochs_to_converge,
+        "status": status,
+    }
+
+
+class HyperparameterSweep:
+    def __init__(self, model_name, space, search="grid", n_trials=20, seed=0, time_budget=10.0,
+                 n_samples=1000, workers=None):
+        self.model_name = model_name
+        self.space = space
+        self.search = search
+        self.n_trials = n_trials
+        self.seed = seed
+        self.time_budget = time_budget  # limit v sekundách na jeden běh
+        self.n_samples = n_samples
+        self.workers = workers or os.cpu_count()
+        self.results = []
+
+    def trials(self):
+        if self.search == "grid":
+            configs = grid_search(self.space)
+        elif self.search == "random":
+            configs = random_search(self.space, self.n_trials, self.seed)
+        else:
+            raise ValueError(f"Unknown search: {self.search}")
+
+        # seed každého běhu závisí jen na seedu sweepu a pořadí běhu
+        return [(trial, params, int(np.random.SeedSequence([self.seed, trial]).generate_state(1)[0]))
+                for trial, params in enumerate(configs)]
+
+    def run(self):
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(run_trial, trial, self.model_name, params, seed,
+                                       self.time_budget, self.n_samples, self.seed)
+                       for trial, params, seed in self.trials()]
+            self.results = [future.result() for future in futures]
+        return self.results
+
+    def table(self):
+        rows = [[self._format(row[column]) for column in COLUMNS] for row in self.results]
+        widths = [max(len(column), *(len(row[i]) for row in rows)) for i, column in enumerate(COLUMNS)]
+        lines = ["  ".join(column.ljust(width) for column, width in zip(COLUMNS, widths))]
+        lines += ["  ".join(value.ljust(width) for value, width in zip(row, widths)) for row in rows]
+        return "\n".join(lines)
+
+    def to_csv(self, path):
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(self.results)
+
+    @staticmethod
+    def _format(value):
+        if value is None:
+            return "-"
+        if isinstance(value, float):
+            return f"{value:.4g}"
+        return str(value)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Paralelní hledání hyperparametrů pro Perceptron / Neuron")
+    parser.add_argument("--model", choices=["perceptron", "neuron"], default="perceptron")
+    parser.add_argument("--search", choices=["grid", "random"], default="grid")
+    parser.add_argument("--lr", type=float, nargs="+", default=[0.001, 0.01, 0.1, 1.0],
+                        help="hodnoty pro grid, u random search dvojice low high")
+    parser.add_argument("--epochs", type=int, nargs="+", default=[10, 100, 1000],
+                        help="hodnoty pro grid, u random search dvojice low high")
+    parser.add_argument("--trials", type=int, default=20, help="počet běhů u random search")
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float, default=10.0, help="časový limit na běh v sekundách")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--csv", default=None, help="uložit výsledky do CSV")
+    args = parser.parse_args()
+
+    if args.search == "random":
+        space = {"lr": tuple(args.lr[:2]), "epochs": tuple(args.epochs[:2])}
+    else:
+        space = {"lr": args.lr, "epochs": args.epochs}
+
+    sweep = HyperparameterSweep(args.model, space, args.search, args.trials, args.seed, args.budget,
+                                args.samples, args.workers)
+    sweep.run()
+    print(sweep.table())
+    if args.csv:
+        sweep.to_csv(args.csv)
@@ -0,0 +1,96 @@
+import numpy as np
+
+from DenseLayer import DenseLayer
+from TrainingCallbacks import ProgressPrinter
+
+
+class NeuralNetwork:
+    def __init__(self, input_size, hidden_size, output_size, lr=0.1, epochs=10000):
+        """
+        :param input_size: počet vstupů
+        :param hidden_size: počet neuronů skryté vrstvy, nebo seznam velikostí pro více skrytých vrstev
+        :param output_size: počet výstupů
+        """
+        self.lr = lr
+        self.epochs = epochs
+        hidden_sizes = list(hidden_size) if isinstance(hidden_size, (list, tuple)) else [hidden_size]
+        sizes = [input_size] + hidden_sizes + [output_size]
+        self.layers = [DenseLayer(sizes[i], sizes[i + 1]) for i in range(len(sizes) - 1)]
+        self.stop_training = False
+        self.history = [] # metriky po epochách z posledního trénování
+
+    @property
+    def hidden_layer(self):
+        # původní API - seznam neuronů (poslední) skryté vrstvy, síť bez skrytých vrstev žádné nemá
+        if len(self.layers) < 2:
+            return []
+        return self.layers[-2].neurons(self)
+
+    @property
+    def output_layer(self):
+        return self.layers[-1].neurons(self)
+
+    def forward_all(self, X):
+        # výstupy všech vrstev, první prvek je samotný vstup
+        activations = [X]
+        for layer in self.layers:
+            activations.append(layer.forward(activations[-1]))
+        return activations
+
+    def forward(self, x): # dopředný průchod
+        activations = self.forward_all(x)
+        return activations[-2], activations[-1] # výstupy (poslední) skryté vrstvy a výstupní vrstvy
+
+    def predict(self, X):
+        return self.forward_all(X)[-1]
+
+    def train_batch(self, X, y):
+        """
+        Jeden krok zpětné propagace pro celou dávku
+        :param X: vstupy (N, d)
+        :param y: očekávané výstupy (N, k)
+        :return: chyba výstupu (N, k)
+        """
+        activations = self.forward_all(X)
+        output_error = y - activations[-1] # chyba výstupu
+        delta = output_error
+        for i in reversed(range(len(self.layers))):
+            delta = self.layers[i].backward(activations[i], activations[i + 1], delta, self.lr)
+        return output_error
+
+    def evaluate(self, X, y):
+        # metriky přes celý dataset jedním dopředným průchodem
+        error = y - self.predict(X)
+        return {"loss": float(np.mean(error ** 2)), "mae": float(np.mean(np.abs(error)))}
+
+    def train(self, X, y, batch_size=1, callbacks=None, log_every=1000):
+        """
+        :param batch_size: velikost mini-dávky, 1 = původní trénování po jednotlivých vzorech
+        :param callbacks: seznam callbacků z TrainingCallbacks, None = výpis každých log_every epoch
+        :param log_every: interval výpisu pro výchozí callback
+        :return: historie metrik po epochách
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float).reshape(len(X), -1) # y na 2D pole
+        batch_size = batch_size or len(X)
+        callbacks = [ProgressPrinter(log_every)] if callbacks is None else callbacks
+
+        self.stop_training = False
+        self.history = []
+        for callback in callbacks:
+            callback.on_train_begin(self)
+
+        for epoch in range(self.epochs):
+            for start in range(0, len(X), batch_size):
+                self.train_batch(X[start:start + batch_size], y[start:start + batch_size])
+
+            logs = {"epoch": epoch, **self.evaluate(X, y)}
+            self.history.append(logs)
+            for callback in callbacks:
+                callback.on_epoch_end(self, epoch, logs)
+            if self.stop_training:
+                break
+
+        for callback in callbacks:
+            callback.on_train_end(self, self.history[-1] if self.history else None)
+        return self.history
@@ -3,9 +3,7 @@ from Task1.Perceptron import Perceptron
 
 class Neuron(Perceptron):
     def __init__(self, input_size, lr=0.1, epochs=100):
-        super().__init__(lr, epochs)
-        self.weights = np.random.randn(input_size)
-        self.bias = np.random.randn()
+        super().__init__(lr, epochs, input_size)
 
     def sigmoid(self, x):
         return 1 / (1 + np.exp(-x))
@@ -14,5 +12,5 @@ class Neuron(Perceptron):
         return x * (1 - x)
 
     def predict(self, x):
-        linear_output = np.dot(self.weights, x) + self.bias
+        linear_output = np.dot(x, self.weights) + self.bias
         return self.sigmoid(linear_output)
\ No newline at end of file
@@ -0,0 +1,94 @@
+import csv
+import json
+
+
+class Callback:
+    """
+    Základ pro callbacky NeuralNetwork.train, logs obsahuje epoch, loss (MSE) a mae přes celý dataset
+    """
+
+    def on_train_begin(self, network):
+        pass
+
+    def on_epoch_end(self, network, epoch, logs):
+        pass
+
+    def on_train_end(self, network, logs):
+        pass
+
+
+class ProgressPrinter(Callback):
+    def __init__(self, every=1000):
+        self.every = every  # jak často vypisovat
+
+    def on_epoch_end(self, network, epoch, logs):
+        if epoch % self.every == 0:
+            print(f"Epoch {epoch}, Loss: {logs['loss']:.6f}, MAE: {logs['mae']:.6f}")
+
+    def on_train_end(self, network, logs):
+        # poslední epochu už mohl vypsat on_epoch_end
+        if logs and logs['epoch'] % self.every != 0:
+            print(f"Epoch {logs['epoch']}, Loss: {logs['loss']:.6f}, MAE: {logs['mae']:.6f}")
+
+
+class MetricsLogger(Callback):
+    """
+    Zápis metrik do souboru, formát podle přípony - .csv nebo .jsonl
+    """
+
+    def __init__(self, path, every=1):
+        self.path = path
+        self.every = every
+        self.file = None
+        self.writer = None
+
+    def on_train_begin(self, network):
+        self.file = open(self.path, "w", newline="")
+        self.writer = None
+
+    def on_epoch_end(self, network, epoch, logs):
+        if epoch % self.every != 0:
+            return
+        if self.path.endswith(".csv"):
+            if self.writer is None:
+                self.writer = csv.DictWriter(self.file, fieldnames=list(logs))
+                self.writer.writeheader()
+            self.writer.writerow(logs)
+        else:
+            self.file.write(json.dumps(logs) + "\n")
+
+    def on_train_end(self, network, logs):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class EarlyStopping(Callback):
+    """
+    Ukončí trénování, když se loss za posledních patience epoch nezlepšila alespoň o min_delta
+    """
+
+    def __init__(self, monitor="loss", patience=100, min_delta=1e-6):
+        self.monitor = monitor
+        self.patience = patience
+        self.min_delta = min_delta
+        self.best = float("inf")
+        self.wait = 0
+        self.stopped_epoch = None
+
+    def on_train_begin(self, network):
+        self.best = float("inf")
+        self.wait = 0
+        self.stopped_epoch = None
+
+    def on_epoch_end(self, network, epoch, logs):
+        if logs[self.monitor] < self.best - self.min_delta:
+            self.best = logs[self.monitor]
+            self.wait = 0
+            return
+
+        self.wait += 1
+        if self.wait >= self.patience:
+            self.stopped_epoch = epoch
+            network.stop_training = True
+            print(f"Early stopping at epoch {epoch}, best {self.monitor}: {self.best:.6f}")
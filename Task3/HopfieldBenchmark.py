@@ -0,0 +1,182 @@
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from HopfieldNetwork import HopfieldNetwork
+from PackedHopfieldNetwork import PackedHopfieldNetwork
+
+NETWORKS = {"dense": HopfieldNetwork, "packed": PackedHopfieldNetwork}
+
+# metriky, kde je větší hodnota horší, a metriky, kde je větší hodnota lepší
+TIME_METRICS = ["train_s", "recall_async_ms", "recall_sync_ms"]
+ACCURACY_METRICS = ["accuracy_async", "accuracy_sync"]
+COLUMNS = ["network", "size", "patterns", "noise"] + TIME_METRICS + ["iterations_async", "iterations_sync"] + ACCURACY_METRICS
+
+
+def best_time(function, repeats, warmup):
+    # warmup rozehřeje cache a alokace, z opakování se bere minimum - šum plánovače přičítá, nikdy neubírá
+    for _ in range(warmup):
+        function()
+    times = []
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark_point(network_name, size, n_patterns, noise, queries, rng, repeats=5, warmup=1):
+    """
+    Jeden bod benchmarku
+    :param repeats: počet měřených opakování, bere se nejrychlejší (u obnovy pro každý dotaz zvlášť)
+    :param warmup: počet neměřených běhů před měřením
+    :return: slovník s časem trénování, latencí obnovy jednoho vzoru, počtem iterací a přesností obnovy
+    """
+    patterns = rng.integers(0, 2, (n_patterns, size))
+    targets = rng.integers(0, n_patterns, queries)
+    flips = rng.random((queries, size)) < noise
+    noisy = patterns[targets] ^ flips
+
+    network = NETWORKS[network_name](size)
+    train_time = best_time(lambda: network.train(patterns), repeats, warmup)
+
+    result = {"network": network_name, "size": size, "patterns": n_patterns, "noise": noise, "train_s": train_time}
+    for mode, recover in (("async", network.recover_async), ("sync", network.recover_sync)):
+        recovered = np.empty_like(noisy)
+        iterations = np.empty(queries)
+        # každý dotaz se měří zvlášť a bere se jeho nejrychlejší opakování - krátký výpadek CPU
+        # tak zkreslí jen jeden dotaz jednoho opakování, ne celý bod
+        times = np.full(queries, np.inf)
+        for repeat in range(warmup + max(1, repeats)):
+            for i in range(queries):
+                start = time.perf_counter()
+                recovered[i] = recover(noisy[i])
+                elapsed = time.perf_counter() - start
+                iterations[i] = network.last_iterations[0]
+                if repeat >= warmup:
+                    times[i] = min(times[i], elapsed)
+
+        result[f"recall_{mode}_ms"] = float(np.mean(times)) * 1000
+        result[f"iterations_{mode}"] = float(np.mean(iterations))
+        result[f"accuracy_{mode}"] = float(np.mean(np.all(recovered == patterns[targets], axis=1)))
+    return result
+
+
+def point_rng(seed, size, n_patterns, noise):
+    # generátor jen podle bodu, ne podle pořadí běhu - podmnožina sweepu dostane stejná data jako plná
+    # baseline a obě sítě se měří na stejných vzorech
+    return np.random.default_rng(np.random.SeedSequence([seed, size, n_patterns, round(noise * 1_000_000)]))
+
+
+def run(networks, sizes, pattern_counts, noises, queries, seed, repeats=5, warmup=1):
+    results = []
+    for network_name in networks:
+        for size in sizes:
+            for n_patterns in pattern_counts:
+                if n_patterns > size:
+                    continue
+                for noise in noises:
+                    rng = point_rng(seed, size, n_patterns, noise)
+                    result = benchmark_point(network_name, size, n_patterns, noise, queries, rng, repeats, warmup)
+                    results.append(result)
+                    print(format_row(result), flush=True)
+    return results
+
+
+def format_row(result):
+    values = []
+    for column in COLUMNS:
+        value = result[column]
+        values.append(f"{value:.4g}" if isinstance(value, float) else str(value))
+    return "  ".join(f"{value:>16}" for value in values)
+
+
+def key(result):
+    return result["network"], result["size"], result["patterns"], result["noise"]
+
+
+def compare(results, baseline, time_tolerance, accuracy_tolerance, min_time=5e-4):
+    """
+    Porovnání s uloženou baseline
+    :param time_tolerance: relativní zpomalení, které se ještě toleruje (0.25 = o 25 %)
+    :param accuracy_tolerance: absolutní pokles přesnosti, který se ještě toleruje
+    :param min_time: absolutní šum v sekundách, přičítá se k relativní toleranci
+    :return: seznam regresí
+    """
+    baseline = {key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        reference = baseline.get(key(result))
+        if reference is None:
+            continue
+        for metric in TIME_METRICS:
+            noise_floor = min_time * 1000 if metric.endswith("_ms") else min_time
+            # relativní i absolutní složka - u velmi krátkých časů by samotná relativní hlásila šum
+            if result[metric] > reference[metric] * (1 + time_tolerance) + noise_floor:
+                regressions.append({"point": key(result), "metric": metric,
+                                    "baseline": reference[metric], "current": result[metric]})
+        for metric in ACCURACY_METRICS:
+            if result[metric] < reference[metric] - accuracy_tolerance:
+                regressions.append({"point": key(result), "metric": metric,
+                                    "baseline": reference[metric], "current": result[metric]})
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark kapacity a konvergence Hopfieldovy sítě")
+    parser.add_argument("--networks", nargs="+", choices=list(NETWORKS), default=["dense"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 400, 1600])
+    parser.add_argument("--patterns", type=int, nargs="+", default=[1, 5, 10, 20, 40])
+    parser.add_argument("--noise", type=float, nargs="+", default=[0.05, 0.1, 0.2, 0.3])
+    parser.add_argument("--queries", type=int, default=20, help="počet rozbitých vzorů na jeden bod")
+    parser.add_argument("--repeats", type=int, default=5, help="počet měření na bod, bere se nejrychlejší")
+    parser.add_argument("--warmup", type=int, default=1, help="počet neměřených běhů před měřením")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="hopfield_benchmark.json", help="soubor s výsledky")
+    parser.add_argument("--baseline", default=None, help="baseline pro kontrolu regresí")
+    parser.add_argument("--save-baseline", default=None, help="soubor, kam uložit výsledky jako baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--accuracy-tolerance", type=float, default=0.05)
+    parser.add_argument("--min-time", type=float, default=5e-4, help="absolutní šum časů v sekundách")
+    args = parser.parse_args()
+
+    print("  ".join(f"{column:>16}" for column in COLUMNS))
+    results = run(args.networks, args.sizes, args.patterns, args.noise, args.queries, args.seed,
+                  args.repeats, args.warmup)
+    report = {
+        "meta": {
+            "seed": args.seed,
+            "queries": args.queries,
+            "repeats": args.repeats,
+            "warmup": args.warmup,
+            "numpy": np.__version__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results saved to {args.output}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.time_tolerance, args.accuracy_tolerance,
+                              args.min_time)
+        for regression in regressions:
+            print(f"REGRESSION {regression['point']} {regression['metric']}: "
+                  f"{regression['baseline']:.4g} -> {regression['current']:.4g}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline")
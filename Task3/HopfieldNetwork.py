@@ -0,0 +1,171 @@
+import numpy as np
+
+
+class HopfieldNetwork:
+    def __init__(self, size):
+        """
+        Konstruktor třídy HopfieldNetwork
+        :param size: Velikost vzorů
+        """
+        self.size = size
+        self.weights = np.zeros((size, size))
+        self.pattern_count = 0
+
+    def train(self, patterns):
+        """
+        Hromadné trénování - váhy se přičtou jedním maticovým součinem patternsᵀ·patterns
+        :param patterns: přijímá pole vzorů
+        :return:
+        """
+        patterns = 2 * np.asarray(patterns, dtype=float).reshape(-1, self.size) - 1
+        self.weights += np.dot(patterns.T, patterns)
+        np.fill_diagonal(self.weights, 0)
+        self.pattern_count += len(patterns)
+
+    def add_pattern(self, pattern):
+        """
+        Přidání jednoho vzoru rank-1 aktualizací vah, O(N²) bez ohledu na počet uložených vzorů
+        :param pattern: vzor
+        :return:
+        """
+        pattern = 2 * np.asarray(pattern, dtype=float) - 1
+        self.weights += np.outer(pattern, pattern)
+        np.fill_diagonal(self.weights, 0)
+        self.pattern_count += 1
+
+    def remove_pattern(self, pattern):
+        """
+        Odebrání dříve uloženého vzoru, inverzní rank-1 aktualizace
+        :param pattern: vzor
+        :return:
+        """
+        pattern = 2 * np.asarray(pattern, dtype=float) - 1
+        self.weights -= np.outer(pattern, pattern)
+        np.fill_diagonal(self.weights, 0)
+        self.pattern_count -= 1
+
+    def energy(self, pattern):
+        """
+        Slouží k výpočtu energie daného vzoru
+        :param pattern: vzor
+        :return:
+        """
+        pattern = 2 * np.array(pattern) - 1
+        energy = -0.5 * np.sum(np.dot(self.weights, pattern) * pattern)
+        return energy
+
+    def recover_sync(self, input_pattern, max_iter=100, order="sequential", seed=None):
+        """
+        Asynchronní obnova vzoru - neuron po neuronu, končí po průchodu, ve kterém se nic neotočilo
+        :param input_pattern: vstpní rozbitý vzor
+        :param max_iter: maximální počet průchodů přes všechny neurony
+        :param order: "sequential" = neurony popořadě, "random" = nová náhodná permutace v každém průchodu
+        :param seed: seed pro náhodné pořadí
+        :return:
+        """
+        return self.recover_batch([input_pattern], max_iter, mode="sync", order=order, seed=seed)[0]
+
+    def recover_async(self, input_pattern, max_iter=100):
+        """
+        Synchronní obnova vzoru
+        :param input_pattern: vstupní rozbitý vzor
+        :param max_iter: maximální počet iterací, končí dřív, když se vzor přestane měnit
+        :return:
+        """
+        return self.recover_batch([input_pattern], max_iter, mode="async")[0]
+
+    def _field(self, states):
+        """
+        Lokální pole pro dávku stavů
+        :param states: matice stavů (B, N) v -1/1
+        :return: matice (B, N)
+        """
+        return np.dot(states, self.weights)  # váhy jsou symetrické
+
+    def _column(self, i):
+        """
+        Váhy neuronu i - o kolik se změní lokální pole všech neuronů, když se neuron i otočí
+        :param i: index neuronu
+        :return: vektor (N,)
+        """
+        return self.weights[i]
+
+    def _sweep(self, states, fields, energies, order):
+        """
+        Jeden průchod neuron po neuronu pro dávku stavů. Lokální pole a energie se nepřepočítávají,
+        ale aktualizují inkrementálně - O(N) na každý otočený neuron
+        :param states: stavy (B, N) v -1/1, mění se na místě
+        :param fields: lokální pole (B, N), mění se na místě
+        :param energies: energie (B,), mění se na místě
+        :param order: pořadí neuronů
+        :return: počet otočených neuronů pro každý řádek
+        """
+        flips = np.zeros(len(states), dtype=int)
+        for i in order:
+            field = fields[:, i]
+            flipped = np.nonzero((field >= 0) != (states[:, i] > 0))[0]
+            if len(flipped) == 0:
+                continue
+            delta = -2 * states[flipped, i]  # změna stavu otočeného neuronu
+            energies[flipped] -= delta * field[flipped]
+            states[flipped, i] += delta
+            fields[flipped] += np.outer(delta, self._column(i))
+            flips[flipped] += 1
+        return flips
+
+    def recover_batch(self, input_patterns, max_iter=100, mode="async", order="sequential", seed=None,
+                      return_info=False):
+        """
+        Obnova celé dávky vzorů najednou, každý řádek má vlastní masku konvergence
+        a zkonvergované řádky se dál nepočítají
+        :param input_patterns: matice rozbitých vzorů (B, N) v 0/1
+        :param max_iter: maximální počet iterací
+        :param mode: "async" = celý vektor najednou jako recover_async, "sync" = neuron po neuronu jako recover_sync
+        :param order: pořadí neuronů v režimu "sync" - "sequential" nebo "random"
+        :param seed: seed pro náhodné pořadí
+        :param return_info: vrátit i počty iterací a energie místo zápisu do self.last_* - síť se pak nemění
+                            a může ji sdílet více vláken
+        :return: obnovené vzory (B, N) v 0/1, počet iterací pro každý řádek je v self.last_iterations
+                 a energie výsledných stavů v self.last_energy
+        """
+        if mode not in ("async", "sync"):
+            raise ValueError(f"Unknown mode: {mode}")
+        if order not in ("sequential", "random"):
+            raise ValueError(f"Unknown order: {order}")
+
+        states = 2 * np.array(input_patterns, dtype=float).reshape(-1, self.size) - 1
+        fields = self._field(states)
+        energies = -0.5 * np.sum(fields * states, axis=1)
+        active = np.arange(len(states))  # indexy řádků, které ještě nezkonvergovaly
+        iterations = np.zeros(len(states), dtype=int)
+        rng = np.random.default_rng(seed)
+
+        for _ in range(max_iter):
+            if len(active) == 0:
+                break
+
+            current = states[active]
+            if mode == "async":
+                updated = np.where(fields[active] >= 0, 1.0, -1.0)
+                changed = np.any(updated != current, axis=1)
+                states[active] = updated
+                fields[active] = self._field(updated)
+                energies[active] = -0.5 * np.sum(fields[active] * updated, axis=1)
+            else:
+                current_fields = fields[active]
+                current_energies = energies[active]
+                neuron_order = rng.permutation(self.size) if order == "random" else range(self.size)
+                changed = self._sweep(current, current_fields, current_energies, neuron_order) > 0
+                states[active] = current
+                fields[active] = current_fields
+                energies[active] = current_energies
+
+            iterations[active] += 1
+            active = active[changed]
+
+        recovered = ((states + 1) // 2).astype(int)  # zpět na 0/1
+        if return_info:
+            return recovered, iterations, energies
+        self.last_iterations = iterations
+        self.last_energy = energies
+        return recovered
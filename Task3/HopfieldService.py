@@ -0,0 +1,188 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from HopfieldNetwork import HopfieldNetwork
+
+
+class ServiceBusy(Exception):
+    """Fronta obnov je plná"""
+
+
+class NoNetworkError(LookupError):
+    """Zatím nebyl uložen žádný vzor"""
+
+
+class InvalidPattern(ValueError):
+    """Vzor nebo režim obnovy neodpovídá síti"""
+
+
+MODES = ("async", "sync")
+
+
+class NetworkSnapshot:
+    """
+    Natrénovaná síť s číslem verze. Po publikování se už nemění - trénování vytvoří novou kopii
+    a referenci na snapshot vymění jedním přiřazením
+    """
+
+    def __init__(self, version, network):
+        self.version = version
+        self.network = network
+
+
+class HopfieldService:
+    def __init__(self, network_class=HopfieldNetwork, max_workers=4, max_queue=64, cache_size=1024,
+                 latency_window=1000):
+        """
+        :param network_class: třída sítě, HopfieldNetwork nebo PackedHopfieldNetwork
+        :param max_workers: počet vláken pro obnovu vzorů
+        :param max_queue: kolik požadavků může čekat ve frontě, další se odmítnou
+        :param cache_size: počet výsledků v LRU cache
+        :param latency_window: z kolika posledních požadavků se počítají latence
+        """
+        self.network_class = network_class
+        self._snapshot = None
+        self._train_lock = threading.Lock()  # trénování jde vždy jen jedno, čtení snapshotu zámek nepotřebuje
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+
+        self._metrics_lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._latencies = deque(maxlen=latency_window)
+
+    def snapshot(self):
+        return self._snapshot
+
+    def add_pattern(self, pattern):
+        with self._train_lock:
+            current = self._snapshot
+            if current is None or current.network.size != len(pattern):
+                network = self.network_class(len(pattern))
+            else:
+                network = copy.deepcopy(current.network)  # publikovaný snapshot se nesmí měnit
+            network.add_pattern(pattern)
+            if getattr(network, "mode", None) == "dense":
+                network._dense_weights()  # líně stavěné váhy musí existovat dřív, než snapshot uvidí vlákna
+            version = 1 if current is None else current.version + 1
+            self._snapshot = NetworkSnapshot(version, network)
+        return version
+
+    def recover(self, pattern, mode="async"):
+        return self.recover_batch([pattern], mode)[0][0]
+
+    def recover_batch(self, patterns, mode="async"):
+        """
+        Obnova vzorů ve worker poolu, opakované dotazy na stejnou verzi sítě jdou z cache
+        :param patterns: matice rozbitých vzorů (B, N) v 0/1
+        :param mode: "async" nebo "sync"
+        :return: obnovené vzory (B, N) a počty iterací (B,), pole jsou jen pro čtení
+        """
+        if mode not in MODES:
+            raise InvalidPattern(f"Unknown mode: {mode}")
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise NoNetworkError("No patterns have been saved yet")
+
+        patterns = np.asarray(patterns, dtype=np.uint8)
+        if patterns.ndim != 2 or patterns.shape[1] != snapshot.network.size:
+            raise InvalidPattern(f"Expected patterns of length {snapshot.network.size}")
+        key = (snapshot.version, mode, patterns.shape, hashlib.sha1(patterns.tobytes()).hexdigest())
+        result = self._cache_get(key)
+        if result is not None:
+            return result
+
+        if not self._slots.acquire(blocking=False):
+            with self._metrics_lock:
+                self._rejected += 1
+            raise ServiceBusy("Recovery queue is full")
+        try:
+            with self._metrics_lock:
+                self._queued += 1
+            future = self._executor.submit(self._run, snapshot.network, patterns, mode, time.perf_counter())
+            result = future.result()
+        finally:
+            self._slots.release()
+
+        for array in result:
+            array.flags.writeable = False
+        self._cache_put(key, result)
+        return result
+
+    def _run(self, network, patterns, mode, enqueued):
+        with self._metrics_lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            recovered, iterations, _ = network.recover_batch(patterns, mode=mode, return_info=True)
+            return recovered, iterations
+        finally:
+            with self._metrics_lock:
+                self._running -= 1
+                self._completed += 1
+                self._latencies.append(time.perf_counter() - enqueued)
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+        with self._metrics_lock:
+            if result is None:
+                self._cache_misses += 1
+            else:
+                self._cache_hits += 1
+        return result
+
+    def _cache_put(self, key, result):
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def metrics(self):
+        snapshot = self._snapshot
+        with self._metrics_lock:
+            latencies = np.array(self._latencies) * 1000
+            metrics = {
+                "version": 0 if snapshot is None else snapshot.version,
+                "patterns": 0 if snapshot is None else snapshot.network.pattern_count,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "cache_hits": self._cache_hits,
+                "cache_misses": self._cache_misses,
+            }
+        with self._cache_lock:
+            metrics["cache_entries"] = len(self._cache)
+
+        if len(latencies):
+            metrics["latency_ms"] = {
+                "mean": float(np.mean(latencies)),
+                "p50": float(np.percentile(latencies, 50)),
+                "p95": float(np.percentile(latencies, 95)),
+                "max": float(np.max(latencies)),
+            }
+        else:
+            metrics["latency_ms"] = None
+        return metrics
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,188 @@
+import numpy as np
+
+from HopfieldNetwork import HopfieldNetwork
+
+
+class PackedHopfieldNetwork(HopfieldNetwork):
+    """
+    Hopfieldova síť pro velké binární vzory. Vzory jsou uložené bitově (np.packbits), váhy buď
+    jako celočíselná matice int8/int16/int32 (režim "dense"), nebo se vůbec neukládají a lokální
+    pole se počítá jako Pᵀ(P·s) - P·s (režim "implicit"), kde P·s se spočítá přes popcount
+    """
+
+    IMPLICIT_RATIO = 8  # v režimu "auto" se použije implicitní režim, dokud je počet vzorů * IMPLICIT_RATIO <= N
+    BLOCK_SIZE = 1 << 22  # maximální počet prvků dočasných float32 bloků
+
+    def __init__(self, size, weight_mode="auto"):
+        """
+        Konstruktor třídy PackedHopfieldNetwork, záměrně nevolá HopfieldNetwork.__init__ (ten alokuje N×N float64)
+        :param size: Velikost vzorů
+        :param weight_mode: "auto", "dense" nebo "implicit"
+        """
+        if weight_mode not in ("auto", "dense", "implicit"):
+            raise ValueError(f"Unknown weight mode: {weight_mode}")
+        self.size = size
+        self.weight_mode = weight_mode
+        self.packed_patterns = np.zeros((0, (size + 7) // 8), dtype=np.uint8)
+        self.weights = None  # celočíselná matice vah, jen v režimu "dense", počítá se líně
+        self.pattern_count = 0
+
+    @property
+    def mode(self):
+        if self.weight_mode != "auto":
+            return self.weight_mode
+        return "implicit" if self.pattern_count * self.IMPLICIT_RATIO <= self.size else "dense"
+
+    def memory_bytes(self):
+        weights = 0 if self.weights is None else self.weights.nbytes
+        return self.packed_patterns.nbytes + weights
+
+    def _pack(self, patterns):
+        patterns = np.asarray(patterns).reshape(-1, self.size)
+        return np.packbits(patterns > 0, axis=1)
+
+    def _rows_per_block(self):
+        return max(1, self.BLOCK_SIZE // max(self.size, self.pattern_count, 1))
+
+    def _weights_dtype(self):
+        for dtype in (np.int8, np.int16, np.int32):
+            if self.pattern_count <= np.iinfo(dtype).max:
+                return dtype
+        return np.int64
+
+    def _signs(self, start, stop):
+        # rozbalení bloku vzorů na float32 -1/1, jen dočasně
+        bits = np.unpackbits(self.packed_patterns[start:stop], axis=1, count=self.size)
+        return 2 * bits.astype(np.float32) - 1
+
+    def _neuron_signs(self, i):
+        # hodnota neuronu i ve všech uložených vzorech
+        bits = (self.packed_patterns[:, i // 8] >> (7 - i % 8)) & 1
+        return 2 * bits.astype(np.float32) - 1
+
+    def _back_project(self, coefficients):
+        """
+        Lineární kombinace vzorů Σ_k c_k·p_k bez rozbalení všech vzorů najednou
+        :param coefficients: matice (B, P)
+        :return: matice (B, N)
+        """
+        result = np.zeros((len(coefficients), self.size))
+        rows = self._rows_per_block()
+        for start in range(0, self.pattern_count, rows):
+            stop = min(start + rows, self.pattern_count)
+            result += np.dot(coefficients[:, start:stop].astype(np.float32), self._signs(start, stop))
+        return result
+
+    def _overlaps(self, states):
+        """
+        Překryv P·s pro každý stav a vzor přes popcount: p·s = N - 2·hamming(p, s)
+        :param states: stavy (B, N) v -1/1
+        :return: matice (B, P)
+        """
+        packed_states = self._pack(states)
+        overlaps = np.empty((len(states), self.pattern_count))
+        for k in range(self.pattern_count):
+            hamming = np.bitwise_count(packed_states ^ self.packed_patterns[k]).sum(axis=1)
+            overlaps[:, k] = self.size - 2 * hamming.astype(np.int64)
+        return overlaps
+
+    def _build_weights(self):
+        # váhy PᵀP - P·I po blocích řádků, aby se nealokovala celá matice ve float;
+        # do self.weights se přiřadí až hotová matice, nikdo nesmí vidět rozpracované bloky
+        weights = np.empty((self.size, self.size), dtype=self._weights_dtype())
+        signs = self._signs(0, self.pattern_count)
+        rows = self._rows_per_block()
+        for start in range(0, self.size, rows):
+            stop = min(start + rows, self.size)
+            weights[start:stop] = np.dot(signs[:, start:stop].T, signs)
+        np.fill_diagonal(weights, 0)
+        self.weights = weights
+
+    def _dense_weights(self):
+        if self.weights is None:
+            self._build_weights()
+        return self.weights
+
+    def _changed(self, pattern, sign):
+        # po přidání / odebrání vzoru - rank-1 aktualizace matice, pokud existuje a nový počet se do typu vejde
+        if self.mode == "implicit":
+            self.weights = None
+            return
+        if self.weights is None or self.weights.dtype != self._weights_dtype():
+            self.weights = None  # postaví se líně při dalším použití
+            return
+        pattern = 2 * (np.asarray(pattern).reshape(self.size) > 0).astype(np.float32) - 1
+        rows = self._rows_per_block()
+        for start in range(0, self.size, rows):
+            stop = min(start + rows, self.size)
+            self.weights[start:stop] += (sign * np.outer(pattern[start:stop], pattern)).astype(self.weights.dtype)
+        np.fill_diagonal(self.weights, 0)
+
+    def train(self, patterns):
+        """
+        Hromadné uložení vzorů
+        :param patterns: přijímá pole vzorů
+        :return:
+        """
+        self.packed_patterns = np.vstack([self.packed_patterns, self._pack(patterns)])
+        self.pattern_count = len(self.packed_patterns)
+        self.weights = None
+
+    def add_pattern(self, pattern):
+        self.packed_patterns = np.vstack([self.packed_patterns, self._pack(pattern)])
+        self.pattern_count += 1
+        self._changed(pattern, 1)
+
+    def remove_pattern(self, pattern):
+        matches = np.nonzero(np.all(self.packed_patterns == self._pack(pattern), axis=1))[0]
+        if len(matches) == 0:
+            raise ValueError("Pattern is not stored in the network")
+        self.packed_patterns = np.delete(self.packed_patterns, matches[0], axis=0)
+        self.pattern_count -= 1
+        self._changed(pattern, -1)
+
+    def energy(self, pattern):
+        pattern = 2 * np.asarray(pattern, dtype=float).reshape(1, self.size) - 1
+        return -0.5 * np.sum(self._field(pattern) * pattern)
+
+    def _field(self, states):
+        states = np.asarray(states, dtype=float)
+        if self.mode == "implicit":
+            return self._back_project(self._overlaps(states)) - self.pattern_count * states
+
+        weights = self._dense_weights()
+        fields = np.empty(states.shape)
+        rows = self._rows_per_block()
+        for start in range(0, self.size, rows):
+            stop = min(start + rows, self.size)
+            fields[:, start:stop] = np.dot(states, weights[start:stop].astype(np.float32).T)
+        return fields
+
+    def _sweep(self, states, fields, energies, order):
+        if self.mode != "implicit":
+            return super()._sweep(states, fields, energies, order)
+
+        # v implicitním režimu se drží překryvy m = P·s, otočení neuronu je aktualizuje v O(P)
+        # a pole neuronu i je p_i·m - P·s_i, takže se nikdy nerozbaluje celý sloupec vah
+        overlaps = self._overlaps(states)
+        flips = np.zeros(len(states), dtype=int)
+        for i in order:
+            signs = self._neuron_signs(i)
+            field = np.dot(overlaps, signs) - self.pattern_count * states[:, i]
+            flipped = np.nonzero((field >= 0) != (states[:, i] > 0))[0]
+            if len(flipped) == 0:
+                continue
+            delta = -2 * states[flipped, i]
+            energies[flipped] -= delta * field[flipped]
+            states[flipped, i] += delta
+            overlaps[flipped] += np.outer(delta, signs)
+            flips[flipped] += 1
+        fields[:] = self._back_project(overlaps) - self.pattern_count * states  # jednou za průchod
+        return flips
+
+    def _column(self, i):
+        if self.mode == "implicit":
+            column = self._back_project(self._neuron_signs(i)[None, :])[0]
+            column[i] = 0
+            return column
+        return self._dense_weights()[i].astype(float)
@@ -1,100 +1,32 @@
-import numpy as np
 from flask import Flask, render_template, request, jsonify
 
+from HopfieldService import MODES, HopfieldService, InvalidPattern, NoNetworkError, ServiceBusy
+
 app = Flask(__name__)
 
-class HopfieldNetwork:
-    def __init__(self, size):
-        """
-        Konstruktor třídy HopfieldNetwork
-        :param size: Velikost vzorů
-        """
-        self.size = size
-        self.weights = np.zeros((size, size))
-
-    def train(self, patterns):
-        """
-        :param patterns: přijímá pole vzorů
-        :return:
-        """
-        for pattern in patterns:
-            pattern = 2 * np.array(pattern) - 1
-            self.weights += np.outer(pattern, pattern)
-        np.fill_diagonal(self.weights, 0)
-
-    def energy(self, pattern):
-        """
-        Slouží k výpočtu energie daného vzoru
-        :param pattern: vzor
-        :return:
-        """
-        pattern = 2 * np.array(pattern) - 1
-        energy = -0.5 * np.sum(np.dot(self.weights, pattern) * pattern)
-        return energy
-
-    def recover_sync(self, input_pattern, max_iter=100, energy_threshold=0.0, patience=10):
-        """
-        Asynchronní obnova vzoru
-        :param input_pattern: vstpní rozbitý vzor
-        :param max_iter: počet iterací
-        :param energy_threshold: threshold pro energii
-        :param patience: tolerance pro energii
-        :return:
-        """
-        input_pattern = 2 * np.array(input_pattern) - 1
-        prev_energy = self.energy(input_pattern)
-        stable_count = 0
-
-        for _ in range(max_iter):
-            for i in range(self.size):
-                sum = np.dot(self.weights[i], input_pattern)
-                input_pattern[i] = 1 if sum >= 0 else -1
-
-            curr_energy = self.energy(input_pattern)
-            if np.abs(curr_energy - prev_energy) < energy_threshold:
-                stable_count += 1
-            else:
-                stable_count = 0
-
-            if stable_count >= patience:
-                break
-
-            prev_energy = curr_energy
-
-        return (input_pattern + 1) // 2  # Convert back to 0/1
-
-    def recover_async(self, input_pattern, max_iter=100, energy_threshold=0.0, patience=10):
-        """
-        Synchronní obnova vzoru
-        :param input_pattern:
-        :param max_iter:
-        :param energy_threshold:
-        :param patience:
-        :return:
-        """
-        input_pattern = 2 * np.array(input_pattern) - 1  # Convert 0/1 to -1/1
-        prev_energy = self.energy(input_pattern)
-        stable_count = 0
-
-        for _ in range(max_iter):
-            sum_vector = np.dot(self.weights, input_pattern)
-            input_pattern = np.sign(sum_vector)
-
-            curr_energy = self.energy(input_pattern)
-            if np.abs(curr_energy - prev_energy) < energy_threshold:
-                stable_count += 1
-            else:
-                stable_count = 0
-
-            if stable_count >= patience:
-                break
-
-            prev_energy = curr_energy
-
-        return (input_pattern + 1) // 2
-
-hopfield = None
-patterns = []
+service = HopfieldService()  # síť, fronta obnov a cache - sdílené všemi požadavky
+
+@app.errorhandler(ServiceBusy)
+def service_busy(error):
+    return jsonify({"status": "error", "message": str(error)}), 503
+
+@app.errorhandler(NoNetworkError)
+@app.errorhandler(InvalidPattern)
+def bad_request(error):
+    return jsonify({"status": "error", "message": str(error)}), 400
+
+def is_pattern(value):
+    return isinstance(value, list) and len(value) > 0 and all(bit in (0, 1) for bit in value)
+
+def json_field(name, check, message):
+    # chybějící nebo neplatné pole požadavku je chyba klienta, ne KeyError / 500
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict) or name not in body or not check(body[name]):
+        raise InvalidPattern(message)
+    return body[name]
+
+def json_pattern():
+    return json_field('pattern', is_pattern, "'pattern' must be a non-empty list of 0/1 values")
 
 @app.route('/')
 def index():
@@ -102,29 +34,43 @@ def index():
 
 @app.route('/save_pattern', methods=['POST'])
 def save_pattern():
-    global patterns, hopfield
+    pattern = json_pattern()
 
-    pattern = request.json['pattern']
-    patterns.append(pattern)
+    version = service.add_pattern(pattern)
 
-    hopfield = HopfieldNetwork(len(pattern))
-    hopfield.train(patterns)
-
-    return jsonify({"status": "success"})
+    return jsonify({"status": "success", "version": version})
 
 @app.route('/recover_pattern', methods=['POST'])
 def recover_pattern():
-    global hopfield
-
-    noisy_pattern = request.json['pattern']
+    noisy_pattern = json_pattern()
 
-    recovered_async = hopfield.recover_async(noisy_pattern)
-    recovered_sync = hopfield.recover_sync(noisy_pattern)
+    recovered_async = service.recover(noisy_pattern, mode='async')
+    recovered_sync = service.recover(noisy_pattern, mode='sync')
 
     return jsonify({
         "recovered_async": recovered_async.tolist(),
         "recovered_sync": recovered_sync.tolist(),
     })
 
+@app.route('/recover_batch', methods=['POST'])
+def recover_batch():
+    noisy_patterns = json_field('patterns', lambda value: isinstance(value, list) and len(value) > 0
+                                and all(is_pattern(row) for row in value),
+                                "'patterns' must be a non-empty list of 0/1 patterns")
+    modes = [json_field('mode', lambda value: value in MODES, f"'mode' must be one of {', '.join(MODES)}")] \
+        if 'mode' in request.json else list(MODES)
+
+    response = {}
+    for mode in modes:
+        recovered, iterations = service.recover_batch(noisy_patterns, mode=mode)
+        response[f"recovered_{mode}"] = recovered.tolist()
+        response[f"iterations_{mode}"] = iterations.tolist()
+
+    return jsonify(response)
+
+@app.route('/metrics')
+def metrics():
+    return jsonify(service.metrics())
+
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True, threaded=True)
\ No newline at end of file
@@ -0,0 +1,120 @@
+import numpy as np
+
+
+class DynamicProgrammingSolver:
+    """
+    Přesné řešení gridworldu bez vzorkování - value iteration nebo policy iteration nad celým polem stavů.
+    Používá stejné tabulky přechodů a odměn jako Q-learning a výsledkem je Q-tabulka ve stejném tvaru,
+    takže s ní funguje i greedy politika z QLearner
+    """
+
+    def __init__(self, env, gamma=0.9, tol=1e-8, max_iter=100000):
+        self.env = env
+        self.gamma = gamma
+        self.tol = tol
+        self.max_iter = max_iter
+        self.iterations = 0
+
+    def _q_values(self, values):
+        q_table = self.env.reward_table + self.gamma * values[self.env.next_state_table]
+        q_table[self.env.state_index(self.env.cheese)] = 0  # ze sýra se už nepokračuje
+        return q_table
+
+    def _evaluate(self, policy, values):
+        # iterativní vyhodnocení pevné politiky
+        states = np.arange(self.env.n_states)
+        next_states = self.env.next_state_table[states, policy]
+        rewards = self.env.reward_table[states, policy]
+        terminal = self.env.state_index(self.env.cheese)
+        for _ in range(self.max_iter):
+            updated = rewards + self.gamma * values[next_states]
+            updated[terminal] = 0
+            converged = np.max(np.abs(updated - values)) < self.tol
+            values = updated
+            if converged:
+                break
+        return values
+
+    def value_iteration(self):
+        values = np.zeros(self.env.n_states)
+        for iteration in range(1, self.max_iter + 1):
+            self.iterations = iteration
+            updated = self._q_values(values).max(axis=1)
+            converged = np.max(np.abs(updated - values)) < self.tol
+            values = updated
+            if converged:
+                break
+        return self._q_values(values).reshape(self.env.grid_size, self.env.grid_size, -1)
+
+    def policy_iteration(self):
+        values = np.zeros(self.env.n_states)
+        policy = np.zeros(self.env.n_states, dtype=np.int64)
+        for iteration in range(1, self.max_iter + 1):
+            self.iterations = iteration
+            values = self._evaluate(policy, values)
+            q_table = self._q_values(values)
+            # při shodě hodnot se drží dosavadní akce, jinak by politika mohla oscilovat
+            improved = np.where(q_table[np.arange(len(policy)), policy] >= q_table.max(axis=1) - self.tol,
+                                policy, q_table.argmax(axis=1))
+            if np.array_equal(improved, policy):
+                break
+            policy = improved
+        return self._q_values(values).reshape(self.env.grid_size, self.env.grid_size, -1)
+
+    def solve(self, method="value"):
+        """
+        :param method: "value" nebo "policy"
+        :return: Q-tabulka (grid_size, grid_size, 4)
+        """
+        if method == "value":
+            return self.value_iteration()
+        if method == "policy":
+            return self.policy_iteration()
+        raise ValueError(f"Unknown method: {method}")
+
+
+def greedy_rollout(env, q_table, max_steps=None):
+    """
+    Průchod greedy politiky ze startu
+    :return: počet kroků, celková odměna a jestli myš došla k sýru
+    """
+    max_steps = env.n_states if max_steps is None else max_steps
+    q_table = q_table.reshape(env.n_states, -1)
+    state = env.state_index(env.start)
+    terminal = env.state_index(env.cheese)
+    total_reward = 0
+    for steps in range(max_steps):
+        if state == terminal:
+            return steps, total_reward, True
+        action = q_table[state].argmax()
+        total_reward += env.reward_table[state, action]
+        state = env.next_state_table[state, action]
+    return max_steps, total_reward, state == terminal
+
+
+def reachable_mask(env):
+    # pole dosažitelná ze startu, ze sýra se už nepokračuje
+    reachable = np.zeros(env.n_states, dtype=bool)
+    frontier = np.array([env.state_index(env.start)])
+    terminal = env.state_index(env.cheese)
+    while len(frontier):
+        reachable[frontier] = True
+        expanded = frontier[frontier != terminal]
+        neighbours = np.unique(env.next_state_table[expanded].ravel())
+        frontier = neighbours[~reachable[neighbours]]
+    return reachable
+
+
+def reachable_states(env):
+    reachable = reachable_mask(env)
+    reachable[env.state_index(env.cheese)] = False
+    return np.flatnonzero(reachable)
+
+
+def policy_agreement(env, q_table, optimal_q_table, tol=1e-6):
+    # podíl dosažitelných stavů, kde je greedy akce z q_table optimální podle optimal_q_table
+    states = reachable_states(env)
+    q_table = q_table.reshape(env.n_states, -1)[states]
+    optimal = optimal_q_table.reshape(env.n_states, -1)[states]
+    chosen = optimal[np.arange(len(states)), q_table.argmax(axis=1)]
+    return float(np.mean(chosen >= optimal.max(axis=1) - tol)) if len(states) else 1.0
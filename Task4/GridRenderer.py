@@ -0,0 +1,142 @@
+import numpy as np
+import pygame
+
+
+class GridRenderer:
+    """
+    Vykreslování mřížky s dirty obdélníky. Statické pozadí (mřížka, stěny, pasti, tlačítka) je předkreslené
+    v jednom Surface a v každém snímku se překreslí a pošle na displej jen buňky, které se změnily
+    """
+
+    WHITE = (255, 255, 255)
+    BLACK = (0, 0, 0)
+    GRAY = (128, 128, 128)
+    BROWN = (139, 69, 19)  # barva pro stěny
+
+    HEAT_LEVELS = 32  # počet odstínů heatmapy, menší změny hodnot buňku nepřekreslí
+    ARROWS = [(0, -1), (0, 1), (-1, 0), (1, 0)]  # šipky greedy politiky pro akce nahoru, dolů, doleva, doprava
+
+    def __init__(self, screen, env, cell_size, grid_height, images, buttons, font):
+        """
+        :param images: obrázky (myš, sýr, past) ve velikosti buňky
+        :param buttons: tlačítka, která se kreslí do pozadí
+        :param font: font pro stavový řádek
+        """
+        self.screen = screen
+        self.env = env
+        self.cell_size = cell_size
+        self.grid_area = pygame.Rect(0, 0, screen.get_width(), grid_height)
+        self.mouse_img, self.cheese_img, self.trap_img = images
+        self.buttons = buttons
+        self.font = font
+        self.background = pygame.Surface(screen.get_size())
+        self.status_rect = pygame.Rect(0, 0, screen.get_width(), font.get_linesize() + 10)
+
+        self._static_dirty = True
+        self._heat = None
+        self._actions = None
+        self._mouse = None
+        self._cheese = None
+        self._status = None
+
+    def invalidate(self):
+        # změna stěn, pastí nebo tlačítek - pozadí se při dalším snímku postaví znovu
+        self._static_dirty = True
+
+    def _build_background(self):
+        self.background.fill(self.WHITE)
+        for x in range(0, self.grid_area.width, self.cell_size):
+            pygame.draw.line(self.background, self.GRAY, (x, 0), (x, self.grid_area.height))
+        for y in range(0, self.grid_area.height, self.cell_size):
+            pygame.draw.line(self.background, self.GRAY, (0, y), (self.grid_area.width, y))
+        for wall in self.env.walls:
+            pygame.draw.rect(self.background, self.BROWN, self._cell_rect(*wall))
+        for trap in self.env.traps:
+            self.background.blit(self.trap_img, self._cell_rect(*trap))
+        for button in self.buttons:
+            button.draw(self.background)
+
+    def _cell_rect(self, x, y):
+        return pygame.Rect(y * self.cell_size, x * self.cell_size, self.cell_size, self.cell_size)
+
+    def _cells_in(self, rect):
+        # buňky (řádek, sloupec), které zasahují do obdélníku na obrazovce
+        rows = range(rect.top // self.cell_size, min(self.env.grid_size, (rect.bottom - 1) // self.cell_size + 1))
+        columns = range(rect.left // self.cell_size, min(self.env.grid_size, (rect.right - 1) // self.cell_size + 1))
+        return [(x, y) for x in rows for y in columns]
+
+    def _overlay(self, q_table):
+        # odstín heatmapy (-1 = bez heatmapy) a greedy akce pro každou buňku
+        values = q_table.max(axis=2)
+        visited = q_table.any(axis=2) & ~self.env.obstacles
+        heat = np.full(values.shape, -1)
+        if visited.any():
+            low, high = values[visited].min(), values[visited].max()
+            t = np.full(values.shape, 0.5) if high <= low else (values - low) / (high - low)
+            heat[visited] = np.round(t[visited] * (self.HEAT_LEVELS - 1))
+        return heat, q_table.argmax(axis=2)
+
+    def _draw_cell(self, x, y, mouse_pos):
+        rect = self._cell_rect(x, y)
+        self.screen.blit(self.background, rect, rect)
+
+        level = self._heat[x, y]
+        if level >= 0:
+            # červená = nízká hodnota, zelená = vysoká, okraj buňky nechá vidět čáry mřížky
+            t = level / (self.HEAT_LEVELS - 1)
+            color = (int(255 - 100 * t), int(155 + 100 * t), 155)
+            pygame.draw.rect(self.screen, color, (rect.x + 1, rect.y + 1, rect.width - 1, rect.height - 1))
+            dx, dy = self.ARROWS[self._actions[x, y]]
+            tip = (rect.centerx + dx * self.cell_size // 3, rect.centery + dy * self.cell_size // 3)
+            pygame.draw.line(self.screen, self.BLACK, rect.center, tip, 3)
+            pygame.draw.circle(self.screen, self.BLACK, tip, 4)
+
+        if (x, y) == self.env.cheese:
+            self.screen.blit(self.cheese_img, rect)
+        if (x, y) == mouse_pos:
+            self.screen.blit(self.mouse_img, rect)
+        return rect.clip(self.grid_area)
+
+    def draw(self, q_table, mouse_pos, status):
+        """
+        Vykreslí snímek a na displej pošle jen změněné oblasti
+        :param q_table: Q-tabulka pro heatmapu a šipky politiky
+        :param mouse_pos: pozice myši
+        :param status: text stavového řádku
+        """
+        heat, actions = self._overlay(q_table)
+        grid_size = self.env.grid_size
+        full = self._static_dirty or self._heat is None or self._heat.shape != heat.shape
+
+        if full:
+            self._build_background()
+            self.screen.blit(self.background, (0, 0))
+            dirty = {(x, y) for x in range(grid_size) for y in range(grid_size)}
+        else:
+            changed = (heat != self._heat) | ((actions != self._actions) & (heat >= 0))
+            dirty = {(int(x), int(y)) for x, y in np.argwhere(changed)}
+            for previous, current in ((self._mouse, mouse_pos), (self._cheese, self.env.cheese)):
+                if previous != current:
+                    dirty.update([previous, current])
+            if status != self._status:
+                # stavový řádek leží přes buňky - pod novým textem se musí překreslit všechny, které zasahuje
+                dirty.update(self._cells_in(self.status_rect))
+
+        self._static_dirty = False
+        self._heat, self._actions = heat, actions
+        self._mouse, self._cheese = mouse_pos, self.env.cheese
+
+        self.screen.set_clip(self.grid_area)  # buňky nesmí přečnívat do lišty s tlačítky
+        rects = [self._draw_cell(x, y, mouse_pos) for x, y in dirty
+                 if self._cell_rect(x, y).colliderect(self.grid_area)]
+        self.screen.set_clip(None)
+
+        if full or status != self._status or any(rect.colliderect(self.status_rect) for rect in rects):
+            text = self.font.render(status, True, self.BLACK, self.WHITE)
+            rects.append(self.screen.blit(text, (5, 5)))
+        self._status = status
+
+        if full:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
@@ -0,0 +1,113 @@
+import numpy as np
+
+
+class GridWorld:
+    """
+    Prostředí bez grafiky - mřížka s myší, sýrem, pastmi a stěnami. Přechody a odměny jsou předpočítané
+    v tabulkách [stav, akce], stav je index pole x * grid_size + y
+    """
+
+    UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+    ACTIONS = [UP, DOWN, LEFT, RIGHT]
+    MOVES = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)])  # posun (dx, dy) pro každou akci
+
+    CHEESE_REWARD = 10  # odměna za nalezení sýra
+    TRAP_REWARD = -10  # trest za nalezení pasti
+    STEP_REWARD = -1  # malá ztráta za každý krok
+
+    def __init__(self, grid_size=10, start=(0, 0), cheese=None, traps=None, walls=None):
+        self.grid_size = grid_size
+        self.n_states = grid_size * grid_size
+        self.start = start
+        self.cheese = cheese if cheese is not None else (grid_size - 1, grid_size - 1)
+        self.traps = []
+        self.walls = []
+        self.trap_grid = np.zeros((grid_size, grid_size), dtype=bool)
+        self.obstacles = np.zeros((grid_size, grid_size), dtype=bool)  # stěny a pasti - nedá se na ně vstoupit
+        for trap in traps or []:
+            self._place(trap, self.traps, True)
+        for wall in walls or []:
+            self._place(wall, self.walls, False)
+
+        self.next_state_table = np.zeros((self.n_states, len(self.ACTIONS)), dtype=np.int64)
+        self.reward_table = np.zeros((self.n_states, len(self.ACTIONS)))
+        self._compile(np.arange(self.n_states))
+
+    def state_index(self, position):
+        return position[0] * self.grid_size + position[1]
+
+    def position(self, state):
+        return divmod(int(state), self.grid_size)
+
+    def _place(self, position, positions, is_trap):
+        positions.append(position)
+        self.obstacles[position] = True
+        if is_trap:
+            self.trap_grid[position] = True
+
+    def _compile(self, states):
+        """
+        Přepočet řádků tabulek přechodů a odměn pro dané stavy
+        :param states: pole indexů stavů
+        :return:
+        """
+        x, y = np.divmod(states, self.grid_size)
+        nx = np.clip(x[:, None] + self.MOVES[:, 0], 0, self.grid_size - 1)
+        ny = np.clip(y[:, None] + self.MOVES[:, 1], 0, self.grid_size - 1)
+        blocked = self.obstacles[nx, ny]  # pokud je tah neplatný, zůstaňte na stejném místě
+        nx = np.where(blocked, x[:, None], nx)
+        ny = np.where(blocked, y[:, None], ny)
+
+        rewards = np.where(self.trap_grid[nx, ny], self.TRAP_REWARD, self.STEP_REWARD)
+        rewards = np.where((nx == self.cheese[0]) & (ny == self.cheese[1]), self.CHEESE_REWARD, rewards)
+
+        self.next_state_table[states] = nx * self.grid_size + ny
+        self.reward_table[states] = rewards
+
+    def _compile_around(self, *positions):
+        # změna jednoho pole ovlivní jen přechody z něj a z jeho sousedů
+        states = set()
+        for x, y in positions:
+            for dx, dy in [(0, 0)] + [tuple(move) for move in self.MOVES]:
+                if 0 <= x + dx < self.grid_size and 0 <= y + dy < self.grid_size:
+                    states.add((x + dx) * self.grid_size + y + dy)
+        self._compile(np.array(sorted(states)))
+
+    def add_trap(self, position):
+        if position != self.start and position != self.cheese and position not in self.traps:
+            self._place(position, self.traps, True)
+            self._compile_around(position)
+
+    def add_wall(self, position):
+        if position != self.start and position != self.cheese and position not in self.walls:
+            self._place(position, self.walls, False)
+            self._compile_around(position)
+
+    def set_start(self, position):
+        self.start = position
+
+    def set_cheese(self, position):
+        previous = self.cheese
+        self.cheese = position
+        self._compile_around(previous, position)
+
+    # kontrola platnosti tahu
+    def valid_move(self, position):
+        x, y = position
+        if x < 0 or y < 0 or x >= self.grid_size or y >= self.grid_size:
+            return False
+        return not self.obstacles[x, y]  # nemůžete jít skrz stěny nebo pasti
+
+    def take_action(self, state, action):
+        return self.position(self.next_state_table[self.state_index(state), action])
+
+    def get_reward(self, state):
+        if state == self.cheese:
+            return self.CHEESE_REWARD
+        elif self.trap_grid[state]:
+            return self.TRAP_REWARD
+        else:
+            return self.STEP_REWARD
+
+    def is_terminal(self, state):
+        return state == self.cheese
@@ -0,0 +1,11 @@
+class GridWorldConfig:
+
+    def __init__(self, grid_size=10, alpha=0.1, gamma=0.9, epsilon=0.2, episodes=10000, max_steps=None, seed=None):
+        self.grid_size = grid_size
+        # parametry Q-learningu
+        self.alpha = alpha
+        self.gamma = gamma
+        self.epsilon = epsilon
+        self.episodes = episodes
+        self.max_steps = max_steps  # limit kroků na epizodu, None = dokud myš nenajde sýr
+        self.seed = seed
@@ -0,0 +1,74 @@
+import argparse
+import time
+
+import numpy as np
+
+from DynamicProgrammingSolver import DynamicProgrammingSolver, greedy_rollout, policy_agreement, reachable_mask
+from GridWorld import GridWorld
+from GridWorldConfig import GridWorldConfig
+from QLearner import QLearner
+
+
+def make_env(grid_size, wall_density, trap_density, seed):
+    # náhodné rozložení, generuje se znovu, dokud není sýr ze startu dosažitelný
+    rng = np.random.default_rng(seed)
+    while True:
+        env = GridWorld(grid_size)
+        cells = rng.random((grid_size, grid_size))
+        for cell in np.argwhere(cells < wall_density):
+            env.add_wall(tuple(int(i) for i in cell))
+        for cell in np.argwhere((cells >= wall_density) & (cells < wall_density + trap_density)):
+            env.add_trap(tuple(int(i) for i in cell))
+        if reachable_mask(env)[env.state_index(env.cheese)]:
+            return env
+
+
+def evaluate(name, env, q_table, optimal_q_table, seconds):
+    steps, total_reward, reached = greedy_rollout(env, q_table)
+    return {
+        "solver": name,
+        "seconds": seconds,
+        "steps": steps,
+        "return": float(total_reward),
+        "reached": reached,
+        "optimal_actions": policy_agreement(env, q_table, optimal_q_table),
+    }
+
+
+def benchmark(grid_size, episodes, wall_density, trap_density, seed):
+    env = make_env(grid_size, wall_density, trap_density, seed)
+    config = GridWorldConfig(grid_size=grid_size, episodes=episodes, max_steps=4 * grid_size ** 2, seed=seed)
+
+    rows = []
+    optimal_q_table = None
+    for method in ["value", "policy"]:
+        solver = DynamicProgrammingSolver(env, gamma=config.gamma)
+        start = time.perf_counter()
+        q_table = solver.solve(method)
+        seconds = time.perf_counter() - start
+        optimal_q_table = q_table if optimal_q_table is None else optimal_q_table
+        rows.append(evaluate(f"{method} iteration ({solver.iterations} it)", env, q_table, optimal_q_table, seconds))
+
+    learner = QLearner(env, config)
+    start = time.perf_counter()
+    learner.train()
+    seconds = time.perf_counter() - start
+    rows.append(evaluate(f"q-learning ({episodes} ep)", env, learner.q_table, optimal_q_table, seconds))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Porovnání dynamického programování a Q-learningu")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 20, 40])
+    parser.add_argument("--episodes", type=int, default=10000)
+    parser.add_argument("--walls", type=float, default=0.15)
+    parser.add_argument("--traps", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for grid_size in args.sizes:
+        print(f"Grid {grid_size}x{grid_size}")
+        for row in benchmark(grid_size, args.episodes, args.walls, args.traps, args.seed):
+            print(f"  {row['solver']:<28} {row['seconds']:>9.4f} s  steps: {row['steps']:>5}  "
+                  f"return: {row['return']:>8.1f}  reached: {str(row['reached']):<5}  "
+                  f"optimal actions: {row['optimal_actions']:.1%}")
@@ -0,0 +1,105 @@
+import random
+import time
+
+import numpy as np
+
+from GridWorld import GridWorld
+from GridWorldConfig import GridWorldConfig
+
+
+class QLearner:
+    """
+    Q-learning nad GridWorld, nepotřebuje pygame a jde spustit i v jiném procesu
+    """
+
+    def __init__(self, env, config):
+        self.env = env
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.q_table = np.zeros((env.grid_size, env.grid_size, len(GridWorld.ACTIONS)))  # 4 akce (nahoru, dolů, doleva, doprava)
+
+    def q_learning_step(self, state, q_table=None, rng=None):
+        # q_table / rng umožní krokovat nad kopií tabulky, např. zatímco learner trénuje jiné vlákno
+        rng = self.rng if rng is None else rng
+        if rng.uniform(0, 1) < self.config.epsilon:
+            action = rng.choice(GridWorld.ACTIONS)  # náhodná akce
+        else:
+            action = self.greedy_action(state, q_table)  # nejlepší akce
+        return action
+
+    def greedy_action(self, state, q_table=None):
+        q_table = self.q_table if q_table is None else q_table
+        return int(np.argmax(q_table[state[0], state[1]]))
+
+    def update_q_table(self, state, action, reward, next_state):
+        max_future_q = np.max(self.q_table[next_state[0], next_state[1]])
+        current_q = self.q_table[state[0], state[1], action]
+        new_q = current_q + self.config.alpha * (reward + self.config.gamma * max_future_q - current_q)
+        self.q_table[state[0], state[1], action] = new_q
+
+    def run_episode(self, start=None, stop=None):
+        """
+        Jedna trénovací epizoda, kroky jsou jen indexace do předpočítaných tabulek prostředí
+        :param start: startovní pozice, None = start prostředí
+        :param stop: funkce bez argumentů kontrolovaná po každém kroku, True epizodu ukončí
+                     (epizoda v uzavřeném bludišti bez max_steps jinak nikdy neskončí)
+        :return: celková odměna a počet kroků
+        """
+        alpha, gamma, epsilon = self.config.alpha, self.config.gamma, self.config.epsilon
+        max_steps = self.config.max_steps
+        next_states = self.env.next_state_table
+        rewards = self.env.reward_table
+        q_table = self.q_table.reshape(self.env.n_states, -1)  # pohled na stejná data, stav = jeden index
+        n_actions = q_table.shape[1]
+        rng = self.rng
+
+        state = self.env.state_index(self.env.start if start is None else start)
+        terminal = self.env.state_index(self.env.cheese)
+        total_reward = 0
+        steps = 0
+        while state != terminal:  # hra skončila
+            if max_steps is not None and steps >= max_steps:
+                break
+            if stop is not None and stop():
+                break
+            if rng.random() < epsilon:
+                action = rng.randrange(n_actions)  # náhodná akce
+            else:
+                action = q_table[state].argmax()  # nejlepší akce
+            next_state = next_states[state, action]
+            reward = rewards[state, action]
+            q_table[state, action] += alpha * (reward + gamma * q_table[next_state].max() - q_table[state, action])
+            state = next_state
+            total_reward += reward
+            steps += 1
+        return total_reward, steps
+
+    def train(self, episodes=None, start=None, callback=None, stop=None):
+        """
+        :param episodes: počet epizod, None = podle konfigurace
+        :param start: startovní pozice epizod
+        :param callback: volá se po každé epizodě s (epizoda, odměna, počet kroků)
+        :param stop: funkce bez argumentů, True ukončí trénování i uprostřed epizody
+        :return: odměny dokončených i přerušené epizody
+        """
+        episodes = self.config.episodes if episodes is None else episodes
+        returns = []
+        for episode in range(episodes):
+            if stop is not None and stop():
+                break
+            total_reward, steps = self.run_episode(start, stop)
+            returns.append(total_reward)
+            if callback is not None:
+                callback(episode, total_reward, steps)
+        return returns
+
+
+if __name__ == "__main__":
+    config = GridWorldConfig(seed=0)
+    env = GridWorld(config.grid_size, walls=[(2, 2), (2, 3), (2, 4), (5, 5)], traps=[(4, 1), (7, 7)])
+    learner = QLearner(env, config)
+
+    start_time = time.time()
+    returns = learner.train()
+    print(f"Training finished in {time.time() - start_time:.2f} s, "
+          f"mean return of last 100 episodes: {np.mean(returns[-100:]):.2f}")
@@ -1,14 +1,23 @@
-import pygame
 import random
-import numpy as np
-import time
+
+import pygame
+
+from DynamicProgrammingSolver import DynamicProgrammingSolver
+from GridWorld import GridWorld
+from GridRenderer import GridRenderer
+from GridWorldConfig import GridWorldConfig
+from QLearner import QLearner
+from TrainingWorker import TrainingWorker
 
 pygame.init()
 
+config = GridWorldConfig()
+
 WIDTH, HEIGHT = 1000, 800
-GRID_SIZE = 10
+GRID_SIZE = config.grid_size
 CELL_SIZE = WIDTH // GRID_SIZE
 BUTTON_HEIGHT = 50
+FPS = 30
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -33,18 +42,17 @@ trap_img = pygame.transform.scale(trap_img, (CELL_SIZE, CELL_SIZE))
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Find the Cheese - Q-Learning")
 
-#parametry Q-learningu
-alpha = 0.1
-gamma = 0.9
-epsilon = 0.2
-q_table = np.zeros((GRID_SIZE, GRID_SIZE, 4))  # 4 akce (nahoru, dolů, doleva, doprava)
+# prostředí a Q-learning jsou bez grafiky, tady je jen jejich zobrazení
+env = GridWorld(GRID_SIZE)
+learner = QLearner(env, config)
+worker = TrainingWorker(learner)  # trénování běží na pozadí, UI jen kreslí poslední snapshot
+demo_rng = random.Random(config.seed)
 
+status_font = pygame.font.Font(None, 24)
+button_font = pygame.font.Font(None, 30)
+clock = pygame.time.Clock()
 
-original_mouse_pos = (0, 0)
-mouse_pos = (0, 0)
-cheese_pos = (GRID_SIZE - 1, GRID_SIZE - 1)
-traps = []
-walls = []
+mouse_pos = env.start
 placing_mode = None
 game_started = False
 is_training = False
@@ -56,13 +64,12 @@ class Button:
         self.color = color
         self.action = action
         self.active = False
+        self.text_surf = button_font.render(self.text, True, BLACK)  # text se vyrenderuje jen jednou
 
-    def draw(self):
-        pygame.draw.rect(screen, self.color if not self.active else DARK_GRAY, self.rect)
-        font = pygame.font.Font(None, 30)
-        text_surf = font.render(self.text, True, BLACK)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+    def draw(self, surface):
+        pygame.draw.rect(surface, self.color if not self.active else DARK_GRAY, self.rect)
+        text_rect = self.text_surf.get_rect(center=self.rect.center)
+        surface.blit(self.text_surf, text_rect)
 
     def click(self, pos):
         if self.rect.collidepoint(pos) and self.action:
@@ -70,68 +77,42 @@ class Button:
 
 # tlačítka
 def start_game():
-    global game_started, mouse_pos, cheese_pos, traps, walls, is_training
+    global game_started, is_training
     game_started = True
     is_training = True
 
     print("Game Started!")
 
 def train_q_learning():
-    global q_table
+    # druhé kliknutí na Train běžící trénování zruší
+    if worker.running:
+        worker.cancel(wait=False)  # UI vlákno na worker nečeká
+        print("Training cancelled!")
+        return
     print("Training agent with Q-learning...")
-    for episode in range(10000):
-        state = mouse_pos
-        done = False
-        while not done:
-            action = q_learning_step(state)
-            next_state = take_action(state, action)
-            reward = get_reward(next_state)
-            update_q_table(state, action, reward, next_state)
-            state = next_state
-            if state == cheese_pos:  # hra skončila
-                done = True
-    print("Training finished!")
-
-def q_learning_step(state):
-    if random.uniform(0, 1) < epsilon:
-        action = random.choice([0, 1, 2, 3])  # náhodná akce 1 - nahoru, 2 - dolů, 3 - doleva, 4 - doprava
-    else:
-        action = np.argmax(q_table[state[0], state[1]])  # nejlepší akce
-    return action
-
-def take_action(state, action):
-    x, y = state
-    if action == 0:  # Up
-        new_state = (max(0, x - 1), y)
-    elif action == 1:  # Down
-        new_state = (min(GRID_SIZE - 1, x + 1), y)
-    elif action == 2:  # Left
-        new_state = (x, max(0, y - 1))
-    elif action == 3:  # Right
-        new_state = (x, min(GRID_SIZE - 1, y + 1))
-    if valid_move(new_state):
-        return new_state
-    return state  # pokud je tah neplatný, zůstaňte na stejném místě
-
-def get_reward(state):
-    if state == cheese_pos:
-        return 10  # odměna za nalezení sýra
-    elif state in traps:
-        return -10  # trest za nalezení pasti
-    else:
-        return -1  # malá ztráta za každý krok
-
-def update_q_table(state, action, reward, next_state):
-    max_future_q = np.max(q_table[next_state[0], next_state[1]])
-    current_q = q_table[state[0], state[1], action]
-    new_q = current_q + alpha * (reward + gamma * max_future_q - current_q)
-    q_table[state[0], state[1], action] = new_q
+    worker.start(start=mouse_pos)
+
+def adjust_param(name, delta):
+    value = min(1.0, max(0.0, round(worker.get_param(name) + delta, 2)))
+    worker.set_params(**{name: value})  # bez běžícího trénování se zapíše rovnou do configu
+    print(f"{name} = {value}")
+
+def plan_value_iteration():
+    # přesné řešení známého rozložení, výsledná Q-tabulka nahradí naučenou
+    # Q-tabulku learneru nesmí zároveň měnit worker, na jeho zastavení se čeká jen krátce
+    if not worker.cancel(timeout=1.0):
+        print("Training is still stopping, try again")
+        return
+    print("Solving with value iteration...")
+    learner.q_table[:] = DynamicProgrammingSolver(env, config.gamma).solve("value")
+    worker.publish()
+    print("Planning finished!")
 
 def reset_game():
-    global mouse_pos, original_mouse_pos,  traps, cheese_pos, walls, is_training, game_started
+    global mouse_pos, is_training, game_started
     is_training = False
     game_started = False
-    mouse_pos = original_mouse_pos
+    mouse_pos = env.start
     print("Game reset!")
 
 def set_mouse():
@@ -165,78 +146,72 @@ buttons = [
     Button("Wall", 860, HEIGHT - BUTTON_HEIGHT, 100, 40, BROWN, set_wall)
 ]
 
-# kontrola platnosti tahu
-def valid_move(position):
-    x, y = position
-    if x < 0 or y < 0 or x >= GRID_SIZE or y >= GRID_SIZE:
-        return False
-    if (x, y) in walls or (x, y) in traps:  # nemůžete jít skrz stěny nebo pasti
-        return False
-    return True
+renderer = GridRenderer(screen, env, CELL_SIZE, HEIGHT - BUTTON_HEIGHT, (mouse_img, cheese_img, trap_img),
+                        buttons, status_font)
 
+def status_text(progress):
+    return (f"Episodes: {progress['episodes_done']}/{progress['episodes_total']}  "
+            f"mean return: {'-' if progress['mean_return'] is None else format(progress['mean_return'], '.1f')}  "
+            f"epsilon: {config.epsilon:.2f} (up/down)  alpha: {config.alpha:.2f} (left/right)  "
+            f"{'training...' if progress['running'] else ''}")
 
 running = True
 
 def main_loop():
-    global mouse_pos, cheese_pos, traps, walls, is_training, original_mouse_pos
+    global mouse_pos
     while running:
-        screen.fill(WHITE)
-
-        # vykreslení gridu
-        for x in range(0, WIDTH, CELL_SIZE):
-            pygame.draw.line(screen, GRAY, (x, 0), (x, HEIGHT - BUTTON_HEIGHT))
-        for y in range(0, HEIGHT - BUTTON_HEIGHT, CELL_SIZE):
-            pygame.draw.line(screen, GRAY, (0, y), (WIDTH, y))
-
-        # kreslení objektů
-        screen.blit(mouse_img, (mouse_pos[1] * CELL_SIZE, mouse_pos[0] * CELL_SIZE))
-        screen.blit(cheese_img, (cheese_pos[1] * CELL_SIZE, cheese_pos[0] * CELL_SIZE))
-        for trap in traps:
-            screen.blit(trap_img, (trap[1] * CELL_SIZE, trap[0] * CELL_SIZE))
-        for wall in walls:
-            pygame.draw.rect(screen, BROWN, (wall[1] * CELL_SIZE, wall[0] * CELL_SIZE, CELL_SIZE, CELL_SIZE))
-
-
-        # kreslení tlačítek
-        for button in buttons:
-            button.draw()
-
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 exit()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_p:
+                    plan_value_iteration()
+                elif event.key == pygame.K_UP:
+                    adjust_param("epsilon", 0.05)
+                elif event.key == pygame.K_DOWN:
+                    adjust_param("epsilon", -0.05)
+                elif event.key == pygame.K_RIGHT:
+                    adjust_param("alpha", 0.05)
+                elif event.key == pygame.K_LEFT:
+                    adjust_param("alpha", -0.05)
             if event.type == pygame.MOUSEBUTTONDOWN:
                 pos = pygame.mouse.get_pos()
                 if pos[1] < HEIGHT - BUTTON_HEIGHT:
                     grid_x, grid_y = pos[1] // CELL_SIZE, pos[0] // CELL_SIZE
                     if placing_mode == "mouse":
                         mouse_pos = (grid_x, grid_y)
-                        original_mouse_pos = mouse_pos
+                        env.set_start(mouse_pos)
                     elif placing_mode == "cheese":
-                        cheese_pos = (grid_x, grid_y)
+                        env.set_cheese((grid_x, grid_y))
                     elif placing_mode == "trap":
-                        if (grid_x, grid_y) != mouse_pos and (grid_x, grid_y) != cheese_pos:
-                            traps.append((grid_x, grid_y))
+                        if (grid_x, grid_y) != mouse_pos:
+                            env.add_trap((grid_x, grid_y))
+                            renderer.invalidate()
                     elif placing_mode == "wall":
-                        if (grid_x, grid_y) != mouse_pos and (grid_x, grid_y) != cheese_pos:
-                            walls.append((grid_x, grid_y))
+                        if (grid_x, grid_y) != mouse_pos:
+                            env.add_wall((grid_x, grid_y))
+                            renderer.invalidate()
                 else:  
                     for button in buttons:
                         button.click(pos)
                         button.active = button.text.lower() == placing_mode
+                    renderer.invalidate()
 
 
 
+        q_table, progress = worker.snapshot()
         if is_training:
-            action = q_learning_step(mouse_pos)
-            mouse_pos = take_action(mouse_pos, action)
+            # ukázka jede nad snapshotem s vlastním generátorem, živou tabulku a rng learneru má worker
+            action = learner.q_learning_step(mouse_pos, q_table, demo_rng)
+            mouse_pos = env.take_action(mouse_pos, action)
             pygame.time.delay(100)
-            if mouse_pos == cheese_pos:
+            if env.is_terminal(mouse_pos):
                 print("Mouse found the cheese!")
                 reset_game()
 
-
-        pygame.display.flip()
+        renderer.draw(q_table, mouse_pos, status_text(progress))
+        clock.tick(FPS)
 
 if __name__ == "__main__":
     main_loop()
\ No newline at end of file
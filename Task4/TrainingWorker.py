@@ -0,0 +1,112 @@
+import threading
+
+import numpy as np
+
+
+class TrainingWorker:
+    """
+    Trénování QLearner ve vlákně na pozadí. Trénuje se po dávkách epizod, po každé dávce se publikuje
+    kopie Q-tabulky a průběh, a mezi dávkami se dá trénování zrušit nebo změnit parametry
+    """
+
+    def __init__(self, learner, chunk_episodes=50):
+        self.learner = learner
+        self.chunk_episodes = chunk_episodes
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread = None
+        self._pending_params = {}
+        self._active = False  # vlákno ještě může číst parametry z configu, chráněno zámkem
+
+        self._q_table = learner.q_table.copy()
+        self._episodes_done = 0
+        self._episodes_total = 0
+        self._mean_return = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, episodes=None, start=None):
+        if self.running:
+            return
+        self._cancel.clear()
+        with self._lock:
+            self._active = True
+            self._episodes_done = 0
+            self._episodes_total = self.learner.config.episodes if episodes is None else episodes
+            self._mean_return = None
+        self._thread = threading.Thread(target=self._run, args=(self._episodes_total, start), daemon=True)
+        self._thread.start()
+
+    def cancel(self, wait=True, timeout=None):
+        """
+        Zrušení se kontroluje po každém kroku epizody, vlákno tedy skončí prakticky hned
+        :param wait: počkat na doběhnutí vlákna
+        :param timeout: nejdelší čekání v sekundách
+        :return: True, pokud už trénování neběží
+        """
+        self._cancel.set()
+        if wait and self._thread is not None:
+            self._thread.join(timeout)
+        return not self.running
+
+    def set_params(self, **params):
+        # změna alpha / gamma / epsilon se projeví od další dávky epizod, bez běžícího trénování hned
+        with self._lock:
+            self._pending_params.update(params)
+            if not self._active:
+                self._apply_params()
+
+    def get_param(self, name):
+        # hodnota parametru včetně změny, která ještě čeká na další dávku
+        with self._lock:
+            return self._pending_params.get(name, getattr(self.learner.config, name))
+
+    def _apply_params(self):
+        # volat jen se zámkem
+        for name, value in self._pending_params.items():
+            setattr(self.learner.config, name, value)
+        self._pending_params.clear()
+
+    def publish(self):
+        # zveřejní aktuální Q-tabulku learneru, např. po změně mimo worker
+        q_table = self.learner.q_table.copy()
+        with self._lock:
+            self._q_table = q_table
+
+    def snapshot(self):
+        """
+        :return: poslední publikovaná kopie Q-tabulky a průběh trénování
+        """
+        with self._lock:
+            return self._q_table, {
+                "running": self.running,
+                "episodes_done": self._episodes_done,
+                "episodes_total": self._episodes_total,
+                "mean_return": self._mean_return,
+            }
+
+    def _run(self, episodes, start):
+        done = 0
+        try:
+            while done < episodes and not self._cancel.is_set():
+                with self._lock:
+                    self._apply_params()
+
+                chunk = min(self.chunk_episodes, episodes - done)
+                returns = self.learner.train(chunk, start, stop=self._cancel.is_set)
+                if not returns:
+                    break
+                done += len(returns)
+
+                q_table = self.learner.q_table.copy()
+                with self._lock:
+                    self._q_table = q_table
+                    self._episodes_done = done
+                    self._mean_return = float(np.mean(returns))
+        finally:
+            # změny, které nestihly další dávku (zrušení, konec trénování), patří do configu
+            with self._lock:
+                self._apply_params()
+                self._active = False
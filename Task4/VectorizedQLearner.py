@@ -0,0 +1,126 @@
+import argparse
+import time
+
+import numpy as np
+
+from GridWorld import GridWorld
+from GridWorldConfig import GridWorldConfig
+
+
+class VectorizedQLearner:
+    """
+    Q-learning s M agenty, kteří se v mřížce pohybují současně a sdílejí jednu Q-tabulku.
+    Jeden krok všech agentů je jen několik NumPy operací nad tabulkami prostředí
+    """
+
+    DEFAULT_STEPS_PER_STATE = 4  # limit kroků na epizodu bez config.max_steps, násobek počtu polí
+
+    def __init__(self, env, config, n_agents=256):
+        self.env = env
+        self.config = config
+        self.n_agents = n_agents
+        self.rng = np.random.default_rng(config.seed)  # jeden generátor kreslí vektor čísel pro všechny agenty
+        self.q_table = np.zeros((env.grid_size, env.grid_size, len(GridWorld.ACTIONS)))
+        self.stats = {}
+
+    def _start_states(self, count, random_starts):
+        if not random_starts:
+            return np.full(count, self.env.state_index(self.env.start))
+        # náhodný start na libovolném volném poli kromě sýra
+        free = np.flatnonzero(~self.env.obstacles.ravel())
+        free = free[free != self.env.state_index(self.env.cheese)]
+        return self.rng.choice(free, count)
+
+    def train(self, episodes=None, random_starts=False):
+        """
+        :param episodes: počet dokončených epizod přes všechny agenty, None = podle konfigurace
+        :param random_starts: každá epizoda začíná na náhodném volném poli místo startu prostředí
+        :return: odměny dokončených epizod
+        """
+        episodes = self.config.episodes if episodes is None else episodes
+        alpha, gamma, epsilon = self.config.alpha, self.config.gamma, self.config.epsilon
+        max_steps = self.config.max_steps
+        if max_steps is None:
+            # bez limitu by odříznutý sýr (stěny, náhodný start v uzavřené kapse) znamenal nekonečnou smyčku
+            max_steps = self.DEFAULT_STEPS_PER_STATE * self.env.n_states
+        next_states = self.env.next_state_table
+        rewards = self.env.reward_table
+        q_table = self.q_table.reshape(self.env.n_states, -1)  # pohled na stejná data
+        q_flat = q_table.reshape(-1)
+        n_actions = q_table.shape[1]
+        terminal = self.env.state_index(self.env.cheese)
+
+        states = self._start_states(self.n_agents, random_starts)
+        returns = np.zeros(self.n_agents)
+        steps = np.zeros(self.n_agents, dtype=np.int64)
+        episode_returns = []
+        total_steps = 0
+
+        start_time = time.perf_counter()
+        while len(episode_returns) < episodes:
+            # epsilon-greedy pro všechny agenty najednou
+            explore = self.rng.random(self.n_agents) < epsilon
+            actions = np.where(explore, self.rng.integers(0, n_actions, self.n_agents), q_table[states].argmax(axis=1))
+
+            next_state = next_states[states, actions]
+            reward = rewards[states, actions]
+            flat = states * n_actions + actions
+            td_error = reward + gamma * q_table[next_state].max(axis=1) - q_flat[flat]
+
+            # více agentů ve stejném (stav, akce) v jednom kroku - použije se průměr jejich TD chyb,
+            # takže výsledek nezávisí na pořadí agentů a neaplikuje se jen poslední zápis
+            unique, inverse = np.unique(flat, return_inverse=True)
+            td_sum = np.bincount(inverse, weights=td_error)
+            td_count = np.bincount(inverse)
+            q_flat[unique] += alpha * td_sum / td_count
+
+            returns += reward
+            steps += 1
+            total_steps += self.n_agents
+            states = next_state
+
+            done = (states == terminal) | (steps >= max_steps)
+            if done.any():
+                episode_returns.extend(returns[done].tolist())
+                states[done] = self._start_states(np.count_nonzero(done), random_starts)
+                returns[done] = 0
+                steps[done] = 0
+
+        elapsed = time.perf_counter() - start_time
+        episode_returns = episode_returns[:episodes]
+        self.stats = {
+            "agents": self.n_agents,
+            "episodes": len(episode_returns),
+            "steps": total_steps,
+            "seconds": elapsed,
+            "episodes_per_s": len(episode_returns) / elapsed if elapsed > 0 else float("inf"),
+            "steps_per_s": total_steps / elapsed if elapsed > 0 else float("inf"),
+        }
+        return episode_returns
+
+    def report(self):
+        print(f"Agents: {self.stats['agents']}, episodes: {self.stats['episodes']}, "
+              f"{self.stats['episodes_per_s']:.0f} episodes/s, {self.stats['steps_per_s']:.0f} steps/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vektorizovaný Q-learning s více agenty")
+    parser.add_argument("--grid-size", type=int, default=200)
+    parser.add_argument("--agents", type=int, default=1024)
+    parser.add_argument("--episodes", type=int, default=10000)
+    parser.add_argument("--walls", type=float, default=0.1, help="podíl polí se stěnou")
+    parser.add_argument("--random-starts", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # náhodné stěny můžou sýr úplně odříznout, limit kroků na epizodu doplní train()
+    config = GridWorldConfig(grid_size=args.grid_size, episodes=args.episodes, seed=args.seed)
+    env = GridWorld(args.grid_size)
+    layout_rng = np.random.default_rng(args.seed)
+    for cell in np.argwhere(layout_rng.random((args.grid_size, args.grid_size)) < args.walls):
+        env.add_wall(tuple(int(i) for i in cell))
+
+    learner = VectorizedQLearner(env, config, args.agents)
+    returns = learner.train(random_starts=args.random_starts)
+    learner.report()
+    print(f"Mean return of last 100 episodes: {np.mean(returns[-100:]):.2f}")
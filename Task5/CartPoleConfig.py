@@ -0,0 +1,64 @@
+from VectorizedCartPole import VectorizedCartPole
+from VectorizedQLearning import StateDiscretizer
+
+
+class CartPoleConfig:
+    """
+    Hyperparameters of all Task5 pipeline stages, passed explicitly to every stage
+    """
+
+    # Small run exercising every stage in seconds (--smoke)
+    SMOKE = {"episodes": 2000, "dataset_samples": 20000, "visited_states": 10000, "nn_epochs": 1,
+             "eval_episodes": 500}
+
+    def __init__(self, learning_rate=0.2, discount=0.95, episodes=100000, aggregate_stats_every=25, n_envs=256,
+                 epsilon=1.0, epsilon_decay=0.99, min_epsilon=0.01, bins=8, solved_threshold=195,
+                 dataset_samples=1000000, visited_states=100000, sample_bandwidth=0.1, nn_learning_rate=0.002,
+                 nn_batch_size=128, nn_epochs=3, nn_backend="keras", eval_episodes=10000, seed=0):
+        # tabular Q-learning
+        self.learning_rate = learning_rate
+        self.discount = discount
+        self.episodes = episodes
+        self.aggregate_stats_every = aggregate_stats_every
+        self.n_envs = n_envs  # CartPoles stepped together by the vectorized trainer
+        self.epsilon = epsilon
+        self.epsilon_decay = epsilon_decay
+        self.min_epsilon = min_epsilon
+        self.bins = bins  # state space discretization per dimension
+        self.solved_threshold = solved_threshold  # early stopping on the mean of the last 50 episodes
+        # distillation dataset, sampled around the states visited during training
+        self.dataset_samples = dataset_samples
+        self.visited_states = visited_states  # reservoir of visited states kept from training
+        self.sample_bandwidth = sample_bandwidth  # jitter around visited states, in standard deviations
+        # distilled network
+        self.nn_learning_rate = nn_learning_rate
+        self.nn_batch_size = nn_batch_size
+        self.nn_epochs = nn_epochs
+        self.nn_backend = nn_backend  # "numpy" trains the same network with NumpyMLP, without TensorFlow
+        self.eval_episodes = eval_episodes
+        self.seed = seed
+
+    @classmethod
+    def smoke(cls, **overrides):
+        return cls(**{**cls.SMOKE, **overrides})
+
+    @property
+    def model_file(self):
+        return "cartpole_model.npz" if self.nn_backend == "numpy" else "cartpole_model.h5"
+
+    def discretizer(self):
+        # VectorizedCartPole has the same observation bounds and actions as gym's CartPole-v1
+        return StateDiscretizer(VectorizedCartPole.observation_low, VectorizedCartPole.observation_high, self.bins)
+
+    def stage_params(self):
+        # Hyperparameters each stage's cache key is computed from
+        return {
+            "tabular": {"learning_rate": self.learning_rate, "discount": self.discount, "episodes": self.episodes,
+                        "n_envs": self.n_envs, "epsilon": self.epsilon, "epsilon_decay": self.epsilon_decay,
+                        "min_epsilon": self.min_epsilon, "bins": self.bins, "solved_threshold": self.solved_threshold,
+                        "visited_states": self.visited_states, "seed": self.seed},
+            "dataset": {"samples": self.dataset_samples, "bandwidth": self.sample_bandwidth, "seed": self.seed},
+            "distill": {"learning_rate": self.nn_learning_rate, "batch_size": self.nn_batch_size,
+                        "epochs": self.nn_epochs, "backend": self.nn_backend, "seed": self.seed},
+            "evaluate": {"episodes": self.eval_episodes, "seed": self.seed},
+        }
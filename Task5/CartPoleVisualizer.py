@@ -0,0 +1,160 @@
+import math
+import tkinter as tk
+
+
+class CartPoleVisualizer:
+    def __init__(self, policy, env_reset, env_step):
+        """
+        :param policy: NumpyPolicy choosing the actions
+        :param env_reset: reset() -> state of the visualized environment
+        :param env_step: step(action) -> (next_state, reward, done)
+        """
+        self.policy = policy
+        self.env_reset = env_reset
+        self.env_step = env_step
+        self.root = tk.Tk()
+        self.root.title("Cart-Pole Balancing with Neural Network")
+        self.root.geometry("800x600")
+
+        self.canvas = tk.Canvas(self.root, width=800, height=400, bg="white")
+        self.canvas.pack(pady=20)
+
+        self.info_frame = tk.Frame(self.root)
+        self.info_frame.pack(fill=tk.X, padx=20)
+
+        self.reward_var = tk.StringVar(value="Total Reward: 0")
+        self.action_var = tk.StringVar(value="Action: None")
+        self.episode_count = 0
+        self.episode_var = tk.StringVar(value="Episode: 0")
+
+        tk.Label(self.info_frame, textvariable=self.reward_var, font=("Arial", 12)).pack(side=tk.LEFT, padx=10)
+        tk.Label(self.info_frame, textvariable=self.action_var, font=("Arial", 12)).pack(side=tk.LEFT, padx=10)
+        tk.Label(self.info_frame, textvariable=self.episode_var, font=("Arial", 12)).pack(side=tk.LEFT, padx=10)
+
+        self.button_frame = tk.Frame(self.root)
+        self.button_frame.pack(fill=tk.X, padx=20, pady=10)
+
+        tk.Button(self.button_frame, text="Start New Episode", command=self.start_episode,
+                  font=("Arial", 12)).pack(side=tk.LEFT, padx=10)
+        tk.Button(self.button_frame, text="Auto Run (5 Episodes)", command=self.auto_run,
+                  font=("Arial", 12)).pack(side=tk.LEFT, padx=10)
+        tk.Button(self.button_frame, text="Stop", command=self.stop, font=("Arial", 12)).pack(side=tk.LEFT, padx=10)
+        tk.Button(self.button_frame, text="Exit", command=self.root.destroy, font=("Arial", 12)).pack(side=tk.RIGHT,
+                                                                                                      padx=10)
+
+        self.speed_frame = tk.Frame(self.root)
+        self.speed_frame.pack(fill=tk.X, padx=20, pady=5)
+
+        tk.Label(self.speed_frame, text="Simulation Speed:", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+        self.speed_var = tk.IntVar(value=50)
+
+        tk.Radiobutton(self.speed_frame, text="Fast", variable=self.speed_var, value=10,
+                       font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
+        tk.Radiobutton(self.speed_frame, text="Medium", variable=self.speed_var, value=50,
+                       font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
+        tk.Radiobutton(self.speed_frame, text="Slow", variable=self.speed_var, value=100,
+                       font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
+
+        self.ground_y = 300
+        self.canvas.create_line(50, self.ground_y, 750, self.ground_y, width=2)
+
+        self.cart_width = 50
+        self.cart_height = 30
+        self.pole_length = 150
+
+        self.running = False
+        self.auto_running = False
+        self.total_reward = 0
+        self.episodes_to_run = 0
+
+    def start_episode(self):
+        if self.running:
+            return
+
+        self.running = True
+        self.total_reward = 0
+        self.episode_count += 1
+        self.episode_var.set(f"Episode: {self.episode_count}")
+        self.reward_var.set(f"Total Reward: {self.total_reward}")
+
+        state = self.env_reset()
+        self.run_simulation(state)
+
+    def auto_run(self):
+        if self.running or self.auto_running:
+            return
+
+        self.auto_running = True
+        self.episodes_to_run = 5
+        self.start_episode()
+
+    def stop(self):
+        self.running = False
+        self.auto_running = False
+        self.episodes_to_run = 0
+
+    def run_simulation(self, state):
+        if not self.running:
+            return
+
+        self.canvas.delete("cart", "pole")
+
+        action = self.policy.act(state)
+        self.action_var.set(f"Action: {'Right' if action == 1 else 'Left'}")
+
+        next_state, reward, done = self.env_step(action)
+
+        self.total_reward += reward
+        self.reward_var.set(f"Total Reward: {self.total_reward:.1f}")
+
+        cart_x = 400 + state[0] * 50
+        cart_y = self.ground_y
+
+        # Draw cart
+        self.canvas.create_rectangle(
+            cart_x - self.cart_width / 2,
+            cart_y - self.cart_height / 2,
+            cart_x + self.cart_width / 2,
+            cart_y + self.cart_height / 2,
+            fill="black",
+            tags="cart"
+        )
+
+        pole_angle = state[2]
+        pole_end_x = cart_x + self.pole_length * math.sin(pole_angle)
+        pole_end_y = cart_y - self.pole_length * math.cos(pole_angle)
+
+        self.canvas.create_line(
+            cart_x,
+            cart_y - self.cart_height / 2,
+            pole_end_x,
+            pole_end_y,
+            width=6,
+            fill="red",
+            tags="pole"
+        )
+
+        if done:
+            self.canvas.create_text(
+                400, 150,
+                text=f"Episode ended with reward: {self.total_reward:.1f}",
+                font=("Arial", 20),
+                fill="red",
+                tags="pole"
+            )
+            self.running = False
+
+            # If in auto run mode, start next episode
+            if self.auto_running and self.episodes_to_run > 1:
+                self.episodes_to_run -= 1
+                self.root.after(1000, self.start_episode)
+            elif self.auto_running:
+                self.auto_running = False
+
+            return
+
+        delay = self.speed_var.get()  # Use the selected speed
+        self.root.after(delay, lambda: self.run_simulation(next_state))
+
+    def start(self):
+        self.root.mainloop()
@@ -0,0 +1,115 @@
+import argparse
+import time
+
+import numpy as np
+
+
+class StateReservoir:
+    """
+    Uniform sample of at most capacity states out of everything passed to add(),
+    used to record the visited-state distribution during training in fixed memory
+    """
+
+    def __init__(self, capacity=100000, state_size=4, seed=None):
+        self.capacity = capacity
+        self.rng = np.random.default_rng(seed)
+        self.buffer = np.empty((capacity, state_size), dtype=np.float32)
+        self.seen = 0
+
+    @property
+    def states(self):
+        return self.buffer[:min(self.seen, self.capacity)]
+
+    def add(self, states):
+        states = np.asarray(states, dtype=np.float32)
+        n = len(states)
+        fill = max(0, min(n, self.capacity - self.seen))
+        self.buffer[self.seen:self.seen + fill] = states[:fill]
+        # reservoir sampling for the rest: the i-th seen state replaces a random slot with probability capacity / i
+        slots = self.rng.integers(0, self.seen + np.arange(fill, n) + 1)
+        keep = slots < self.capacity
+        self.buffer[slots[keep]] = states[fill:][keep]
+        self.seen += n
+
+    def save(self, path):
+        np.save(path, self.states)
+
+
+def build_dataset(q_table, discretizer, visited_states, n_samples, X_path, y_path, bandwidth=0.1,
+                  chunk_size=1000000, seed=None):
+    """
+    Samples states around the visited ones (resampling plus gaussian jitter of bandwidth * std per dimension),
+    labels them with q_table and writes both to .npy files that np.load can memory-map
+    :param visited_states: states recorded during training, e.g. StateReservoir.states
+    :param chunk_size: states generated and labelled by one vectorized call
+    :return: memory-mapped (X, y)
+    """
+    rng = np.random.default_rng(seed)
+    visited_states = np.asarray(visited_states, dtype=np.float32)
+    scale = bandwidth * visited_states.std(axis=0)
+    X = np.lib.format.open_memmap(X_path, mode="w+", dtype=np.float32, shape=(n_samples, visited_states.shape[1]))
+    y = np.lib.format.open_memmap(y_path, mode="w+", dtype=np.float32, shape=(n_samples, q_table.shape[-1]))
+
+    for start in range(0, n_samples, chunk_size):
+        stop = min(start + chunk_size, n_samples)
+        states = visited_states[rng.integers(0, len(visited_states), stop - start)]
+        states += rng.normal(0, 1, states.shape).astype(np.float32) * scale
+        X[start:stop] = states
+        y[start:stop] = q_table[discretizer(states)]
+    X.flush()
+    y.flush()
+    return X, y
+
+
+def load_dataset(X_path, y_path):
+    return np.load(X_path, mmap_mode="r"), np.load(y_path, mmap_mode="r")
+
+
+def keras_batches(X, y, batch_size=128, shuffle=True, seed=None):
+    """
+    keras.utils.PyDataset reading batches straight from the memory-mapped arrays, so model.fit
+    streams the dataset instead of loading it. Batches are contiguous slices visited in shuffled order
+    """
+    from tensorflow import keras
+
+    class MemmapBatches(keras.utils.PyDataset):
+        def __init__(self):
+            super().__init__()
+            self.rng = np.random.default_rng(seed)
+            self.order = np.arange(-(-len(X) // batch_size))
+            self.on_epoch_end()
+
+        def __len__(self):
+            return len(self.order)
+
+        def __getitem__(self, index):
+            start = self.order[index] * batch_size
+            return np.asarray(X[start:start + batch_size]), np.asarray(y[start:start + batch_size])
+
+        def on_epoch_end(self):
+            if shuffle:
+                self.rng.shuffle(self.order)
+
+    return MemmapBatches()
+
+
+if __name__ == "__main__":
+    from VectorizedCartPole import VectorizedCartPole
+    from VectorizedQLearning import StateDiscretizer
+
+    parser = argparse.ArgumentParser(description="Build the distillation dataset from a q_table and visited states")
+    parser.add_argument("--q-table", default="q_table.npy")
+    parser.add_argument("--visited", default="visited_states.npy")
+    parser.add_argument("--samples", type=int, default=5000000)
+    parser.add_argument("--bandwidth", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    q_table = np.load(args.q_table)
+    discretizer = StateDiscretizer(VectorizedCartPole.observation_low, VectorizedCartPole.observation_high,
+                                   q_table.shape[0])
+    start_time = time.perf_counter()
+    X, y = build_dataset(q_table, discretizer, np.load(args.visited), args.samples, "dataset_X.npy", "dataset_y.npy",
+                         args.bandwidth, seed=args.seed)
+    elapsed = time.perf_counter() - start_time
+    print(f"{len(X)} samples in {elapsed:.2f} s ({len(X) / elapsed:.0f} samples/s)")
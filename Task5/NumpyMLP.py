@@ -0,0 +1,101 @@
+import time
+
+import numpy as np
+
+from NumpyPolicy import NumpyPolicy
+
+
+class NumpyMLP:
+    """
+    NumPy-only trainer for the distillation network: Dense layers with relu hidden activations and a
+    linear output, he_uniform / glorot_uniform initialization, Adam and MSE loss like the Keras model,
+    without importing TensorFlow
+    """
+
+    def __init__(self, layer_sizes=(4, 32, 16, 2), learning_rate=0.002, beta_1=0.9, beta_2=0.999, epsilon=1e-7,
+                 seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.learning_rate = learning_rate
+        self.beta_1 = beta_1
+        self.beta_2 = beta_2
+        self.epsilon = epsilon
+        self.weights = []
+        self.biases = []
+        for i, (fan_in, fan_out) in enumerate(zip(layer_sizes[:-1], layer_sizes[1:])):
+            hidden = i < len(layer_sizes) - 2
+            # he_uniform for the relu layers, Keras' default glorot_uniform for the output layer
+            limit = np.sqrt(6 / fan_in) if hidden else np.sqrt(6 / (fan_in + fan_out))
+            self.weights.append(self.rng.uniform(-limit, limit, (fan_in, fan_out)).astype(np.float32))
+            self.biases.append(np.zeros(fan_out, dtype=np.float32))
+        self.activations = ["relu"] * (len(self.weights) - 1) + ["linear"]
+
+        self._params = self.weights + self.biases
+        self._m = [np.zeros_like(p) for p in self._params]
+        self._v = [np.zeros_like(p) for p in self._params]
+        self._t = 0
+        self.history = {"loss": [], "val_loss": []}
+
+    def _forward(self, X):
+        outputs = [X]
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            z = outputs[-1] @ w + b
+            outputs.append(np.maximum(z, 0) if i < len(self.weights) - 1 else z)
+        return outputs
+
+    def predict(self, X):
+        return self._forward(np.asarray(X, dtype=np.float32))[-1]
+
+    def evaluate(self, X, y, batch_size=65536):
+        total = 0.0
+        for start in range(0, len(X), batch_size):
+            error = self.predict(X[start:start + batch_size]) - np.asarray(y[start:start + batch_size])
+            total += float(np.sum(error ** 2))
+        return total / (len(X) * self.weights[-1].shape[1])
+
+    def train_batch(self, X, y):
+        outputs = self._forward(X)
+        error = outputs[-1] - y
+        delta = 2 * error / error.size  # d(MSE)/d(output)
+
+        grads_w, grads_b = [], []
+        for i in reversed(range(len(self.weights))):
+            grads_w.append(outputs[i].T @ delta)
+            grads_b.append(delta.sum(axis=0))
+            if i > 0:
+                delta = (delta @ self.weights[i].T) * (outputs[i] > 0)
+        grads = grads_w[::-1] + grads_b[::-1]
+
+        self._t += 1
+        correction = np.sqrt(1 - self.beta_2 ** self._t) / (1 - self.beta_1 ** self._t)
+        for p, g, m, v in zip(self._params, grads, self._m, self._v):
+            m *= self.beta_1
+            m += (1 - self.beta_1) * g
+            v *= self.beta_2
+            v += (1 - self.beta_2) * g * g
+            p -= self.learning_rate * correction * m / (np.sqrt(v) + self.epsilon)
+        return float(np.mean(error ** 2))
+
+    def fit(self, X, y, batch_size=128, epochs=3, validation_data=None, verbose=1):
+        """
+        Arrays may be memory-mapped, every batch is a contiguous slice read in shuffled order
+        :return: history with loss and val_loss per epoch
+        """
+        n_batches = -(-len(X) // batch_size)
+        for epoch in range(epochs):
+            start_time = time.perf_counter()
+            losses = []
+            for batch in self.rng.permutation(n_batches):
+                start = batch * batch_size
+                losses.append(self.train_batch(np.asarray(X[start:start + batch_size], dtype=np.float32),
+                                               np.asarray(y[start:start + batch_size], dtype=np.float32)))
+            self.history["loss"].append(float(np.mean(losses)))
+            message = f"Epoch {epoch + 1}/{epochs} - {time.perf_counter() - start_time:.1f}s - loss: {np.mean(losses):.4f}"
+            if validation_data is not None:
+                self.history["val_loss"].append(self.evaluate(*validation_data))
+                message += f" - val_loss: {self.history['val_loss'][-1]:.4f}"
+            if verbose:
+                print(message)
+        return self.history
+
+    def to_policy(self):
+        return NumpyPolicy(self.weights, self.biases, self.activations)
@@ -0,0 +1,119 @@
+import argparse
+import time
+
+import numpy as np
+
+ACTIVATIONS = {
+    "relu": lambda x: np.maximum(x, 0),
+    "linear": lambda x: x,
+    "tanh": np.tanh,
+    "sigmoid": lambda x: 1 / (1 + np.exp(-x)),
+}
+
+
+class NumpyPolicy:
+    """
+    Plain NumPy forward pass of a stack of Dense layers exported from a trained Keras model.
+    For the tiny CartPole network this costs microseconds per state instead of the milliseconds
+    of framework overhead of model.predict
+    """
+
+    def __init__(self, weights, biases, activations):
+        self.weights = [np.asarray(w, dtype=np.float32) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.activations = list(activations)
+        self._functions = [ACTIVATIONS[name] for name in self.activations]
+
+    @classmethod
+    def from_keras(cls, model):
+        weights, biases, activations = [], [], []
+        for layer in model.layers:
+            params = layer.get_weights()
+            if not params:
+                continue  # InputLayer, Dropout, ... have nothing to export
+            weights.append(params[0])
+            biases.append(params[1])
+            activations.append(layer.activation.__name__)
+        return cls(weights, biases, activations)
+
+    def save(self, path):
+        arrays = {f"weights_{i}": w for i, w in enumerate(self.weights)}
+        arrays.update({f"bias_{i}": b for i, b in enumerate(self.biases)})
+        np.savez(path, activations=np.array(self.activations), **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            n = len(data["activations"])
+            return cls([data[f"weights_{i}"] for i in range(n)], [data[f"bias_{i}"] for i in range(n)],
+                       [str(a) for a in data["activations"]])
+
+    def predict(self, states):
+        """
+        :param states: batch of states of shape (N, 4)
+        :return: Q-values of shape (N, n_actions)
+        """
+        x = np.asarray(states, dtype=np.float32)
+        for w, b, f in zip(self.weights, self.biases, self._functions):
+            x = f(x @ w + b)
+        return x
+
+    def predict_one(self, state):
+        """
+        :param state: single state of shape (4,)
+        :return: Q-values of shape (n_actions,)
+        """
+        return self.predict(state)  # 1-D input goes through the same vector-matrix products
+
+    def act(self, states):
+        """
+        :return: greedy action for a single state or an array of actions for a batch
+        """
+        return np.argmax(self.predict(states), axis=-1)
+
+
+def benchmark(model, policy, states, repeats=200):
+    """
+    Compares per-call latency of model.predict and the NumPy path for single states and a whole batch
+    :return: dict of latencies in microseconds and the largest difference between the Q-values
+    """
+    def latency(function, calls):
+        start = time.perf_counter()
+        for i in range(calls):
+            function(i)
+        return (time.perf_counter() - start) / calls * 1e6
+
+    states = np.asarray(states, dtype=np.float32)
+    keras_calls = min(repeats, len(states))
+    results = {
+        "keras_single_us": latency(lambda i: model.predict(states[i:i + 1], verbose=0), keras_calls),
+        "numpy_single_us": latency(lambda i: policy.predict_one(states[i % len(states)]), repeats * 10),
+        "keras_batch_us": latency(lambda i: model.predict(states, batch_size=len(states), verbose=0), 10),
+        "numpy_batch_us": latency(lambda i: policy.predict(states), repeats),
+        "max_abs_diff": float(np.abs(model.predict(states, verbose=0) - policy.predict(states)).max()),
+    }
+    results["single_speedup"] = results["keras_single_us"] / results["numpy_single_us"]
+    results["batch_speedup"] = results["keras_batch_us"] / results["numpy_batch_us"]
+    return results
+
+
+if __name__ == "__main__":
+    from tensorflow import keras
+
+    parser = argparse.ArgumentParser(description="Latency of model.predict vs the NumPy inference path")
+    parser.add_argument("--model", default="cartpole_model.h5")
+    parser.add_argument("--batch", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    model = keras.models.load_model(args.model, compile=False)
+    policy = NumpyPolicy.from_keras(model)
+    rng = np.random.default_rng(args.seed)
+    states = rng.uniform([-2.4, -3, -0.21, -3.5], [2.4, 3, 0.21, 3.5], (args.batch, 4))
+
+    results = benchmark(model, policy, states)
+    print(f"Single state: keras {results['keras_single_us']:.0f} us, numpy {results['numpy_single_us']:.1f} us "
+          f"({results['single_speedup']:.0f}x)")
+    print(f"Batch of {args.batch}: keras {results['keras_batch_us']:.0f} us, numpy {results['numpy_batch_us']:.1f} us "
+          f"({results['batch_speedup']:.0f}x)")
+    print(f"Max |Q difference|: {results['max_abs_diff']:.2e}")
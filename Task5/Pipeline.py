@@ -0,0 +1,58 @@
+import hashlib
+import json
+import os
+
+
+class Pipeline:
+    """
+    Runs stages whose results are files on disk. A stage is skipped when its outputs exist and its key -
+    a hash of its hyperparameters, seed and the keys of the stages it depends on - matches the last run
+    """
+
+    def __init__(self, artifact_dir=".", state_file="pipeline.json", force=()):
+        """
+        :param force: names of stages to run even if they are up to date
+        """
+        self.artifact_dir = artifact_dir
+        os.makedirs(artifact_dir, exist_ok=True)
+        self.state_path = os.path.join(artifact_dir, state_file)
+        self.state = {}
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                self.state = json.load(f)
+        self.force = set(force)
+        self.keys = {}
+        self.ran = set()
+
+    def path(self, name):
+        return os.path.join(self.artifact_dir, name)
+
+    def stage(self, name, params, outputs, build, after=()):
+        """
+        :param params: JSON serializable hyperparameters and seed of the stage
+        :param outputs: artifact file names written by the stage
+        :param build: called as build(*paths) to create the artifacts
+        :param after: names of the stages whose artifacts this stage reads
+        :return: paths of the artifacts
+        """
+        payload = json.dumps({"params": params, "after": [self.keys[n] for n in after]}, sort_keys=True)
+        key = hashlib.sha256(payload.encode()).hexdigest()[:16]
+        self.keys[name] = key
+        paths = [self.path(output) for output in outputs]
+
+        # a rerun upstream stage may have written different artifacts even with the same key
+        up_to_date = (self.state.get(name) == key and all(os.path.exists(p) for p in paths)
+                      and name not in self.force and not self.ran.intersection(after))
+        if up_to_date:
+            print(f"Stage {name}: up to date ({key}), skipping")
+            return paths
+
+        print(f"Stage {name}: running ({key})")
+        build(*paths)
+        self.ran.add(name)
+        self.state[name] = key
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+        return paths
@@ -0,0 +1,150 @@
+import argparse
+import json
+import time
+
+import numpy as np
+
+from VectorizedCartPole import VectorizedCartPole
+from VectorizedQLearning import StateDiscretizer
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def q_table_policy(q_table, discretizer):
+    """
+    :return: function mapping a batch of states to the greedy actions of q_table
+    """
+    return lambda states: q_table[discretizer(states)].argmax(axis=-1)
+
+
+def policy_agreement(policy_a, policy_b, states):
+    """
+    :return: fraction of states where both policies pick the same action
+    """
+    return float(np.mean(policy_a(states) == policy_b(states)))
+
+
+class PolicyEvaluator:
+    """
+    Headless evaluation of CartPole policies. Episodes run side by side on a VectorizedCartPole,
+    each environment plays exactly one episode so short episodes are not over-represented
+    """
+
+    def __init__(self, episodes=10000, batch_size=1000, max_episode_steps=500, seed=0, max_states=100000):
+        """
+        :param batch_size: episodes stepped together
+        :param max_states: visited states kept for the policy agreement
+        """
+        self.episodes = episodes
+        self.batch_size = batch_size
+        self.max_episode_steps = max_episode_steps
+        self.seed = seed
+        self.max_states = max_states
+
+    def run(self, policy):
+        """
+        :param policy: function mapping a batch of states (N, 4) to actions (N,)
+        :return: (episode lengths, visited states, stats dict)
+        """
+        # one independent stream per batch of environments plus one for subsampling the visited states
+        seeds = np.random.SeedSequence(self.seed).spawn(-(-self.episodes // self.batch_size) + 1)
+        rng = np.random.default_rng(seeds.pop())
+        lengths = []
+        visited = []
+        total_steps = 0
+
+        start_time = time.perf_counter()
+        for batch, seed in enumerate(seeds):
+            n_envs = min(self.batch_size, self.episodes - batch * self.batch_size)
+            env = VectorizedCartPole(n_envs, self.max_episode_steps, seed)
+            states = env.reset()
+            length = np.zeros(n_envs, dtype=np.int64)
+            active = np.ones(n_envs, dtype=bool)
+            while active.any():
+                visited.append(states[active])
+                _, _, terminated, truncated, info = env.step(policy(states))
+                length += active
+                total_steps += int(np.count_nonzero(active))
+                active &= ~(terminated | truncated)
+                states = info["final_observation"]  # finished environments are ignored from now on
+            lengths.append(length)
+        elapsed = time.perf_counter() - start_time
+
+        lengths = np.concatenate(lengths)
+        visited = np.concatenate(visited)
+        if len(visited) > self.max_states:
+            visited = visited[rng.choice(len(visited), self.max_states, replace=False)]
+
+        stats = {
+            "episodes": len(lengths),
+            "mean_length": float(lengths.mean()),
+            "std_length": float(lengths.std()),
+            "min_length": int(lengths.min()),
+            "max_length": int(lengths.max()),
+            "solved_rate": float(np.mean(lengths >= self.max_episode_steps)),
+            "steps": total_steps,
+            "seconds": elapsed,
+            "steps_per_s": total_steps / elapsed if elapsed > 0 else float("inf"),
+        }
+        for q, value in zip(PERCENTILES, np.percentile(lengths, PERCENTILES)):
+            stats[f"p{q}_length"] = float(value)
+        return lengths, visited, stats
+
+    def compare(self, policies):
+        """
+        Evaluates every policy and the pairwise agreement on the states all of them visited
+        :param policies: dict name -> policy function
+        :return: dict with stats per policy and "agreement" per pair of names
+        """
+        report = {}
+        visited = []
+        for name, policy in policies.items():
+            _, states, report[name] = self.run(policy)
+            visited.append(states)
+        visited = np.concatenate(visited)
+
+        names = list(policies)
+        report["agreement"] = {
+            f"{a}/{b}": policy_agreement(policies[a], policies[b], visited)
+            for i, a in enumerate(names) for b in names[i + 1:]
+        }
+        return report
+
+
+def print_report(report):
+    for name, stats in report.items():
+        if name == "agreement":
+            continue
+        percentiles = ", ".join(f"p{q}={stats[f'p{q}_length']:.0f}" for q in PERCENTILES)
+        print(f"{name}: {stats['episodes']} episodes, mean length {stats['mean_length']:.1f} "
+              f"(std {stats['std_length']:.1f}; {percentiles}), solved {stats['solved_rate']:.1%}, "
+              f"{stats['steps_per_s']:.0f} steps/s")
+    for pair, rate in report.get("agreement", {}).items():
+        print(f"Agreement {pair}: {rate:.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless batch evaluation of the CartPole policies")
+    parser.add_argument("--q-table", default="q_table.npy")
+    parser.add_argument("--model", default="cartpole_model.h5", help="empty to evaluate only the q_table")
+    parser.add_argument("--episodes", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the report as JSON")
+    args = parser.parse_args()
+
+    q_table = np.load(args.q_table)
+    discretizer = StateDiscretizer(VectorizedCartPole.observation_low, VectorizedCartPole.observation_high,
+                                   q_table.shape[0])
+    policies = {"q_table": q_table_policy(q_table, discretizer)}
+    if args.model:
+        from tensorflow import keras
+        from NumpyPolicy import NumpyPolicy
+
+        policies["model"] = NumpyPolicy.from_keras(keras.models.load_model(args.model, compile=False)).act
+
+    report = PolicyEvaluator(args.episodes, args.batch, seed=args.seed).compare(policies)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
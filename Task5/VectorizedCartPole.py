@@ -0,0 +1,74 @@
+import numpy as np
+
+
+class VectorizedCartPole:
+    """
+    Pure NumPy CartPole-v1 stepping n_envs environments at once.
+    Dynamics, termination and truncation follow gym's CartPole-v1 (euler integration, 12 degrees,
+    2.4 units, 500 steps). Finished environments are reset automatically, like gym's vector envs.
+    """
+
+    gravity = 9.8
+    masscart = 1.0
+    masspole = 0.1
+    total_mass = masspole + masscart
+    length = 0.5  # half the pole's length
+    polemass_length = masspole * length
+    force_mag = 10.0
+    tau = 0.02  # seconds between state updates
+    theta_threshold_radians = 12 * 2 * np.pi / 360
+    x_threshold = 2.4
+
+    n_actions = 2
+    observation_high = np.array([x_threshold * 2, np.finfo(np.float32).max, theta_threshold_radians * 2,
+                                 np.finfo(np.float32).max], dtype=np.float32)
+    observation_low = -observation_high
+
+    def __init__(self, n_envs=256, max_episode_steps=500, seed=None):
+        self.n_envs = n_envs
+        self.max_episode_steps = max_episode_steps
+        self.rng = np.random.default_rng(seed)
+        self.states = np.zeros((n_envs, 4))
+        self.steps = np.zeros(n_envs, dtype=np.int64)
+
+    def reset(self):
+        self.states = self.rng.uniform(-0.05, 0.05, (self.n_envs, 4))
+        self.steps[:] = 0
+        return self.states.astype(np.float32)
+
+    def step(self, actions):
+        """
+        :param actions: array of n_envs actions (0 = push left, 1 = push right)
+        :return: observations, rewards, terminated, truncated, info - observations of finished environments
+            are already from the next episode, their last observations are in info["final_observation"]
+        """
+        x, x_dot, theta, theta_dot = self.states.T
+        force = np.where(np.asarray(actions) == 1, self.force_mag, -self.force_mag)
+        costheta = np.cos(theta)
+        sintheta = np.sin(theta)
+
+        temp = (force + self.polemass_length * theta_dot ** 2 * sintheta) / self.total_mass
+        thetaacc = (self.gravity * sintheta - costheta * temp) / (
+            self.length * (4.0 / 3.0 - self.masspole * costheta ** 2 / self.total_mass))
+        xacc = temp - self.polemass_length * thetaacc * costheta / self.total_mass
+
+        x = x + self.tau * x_dot
+        x_dot = x_dot + self.tau * xacc
+        theta = theta + self.tau * theta_dot
+        theta_dot = theta_dot + self.tau * thetaacc
+        self.states = np.stack([x, x_dot, theta, theta_dot], axis=1)
+        self.steps += 1
+
+        terminated = ((x < -self.x_threshold) | (x > self.x_threshold)
+                      | (theta < -self.theta_threshold_radians) | (theta > self.theta_threshold_radians))
+        truncated = (self.steps >= self.max_episode_steps) & ~terminated
+        rewards = np.ones(self.n_envs, dtype=np.float32)  # gym rewards the terminating step too
+
+        observations = self.states.astype(np.float32)
+        info = {"final_observation": observations.copy()}
+        done = terminated | truncated
+        if done.any():
+            self.states[done] = self.rng.uniform(-0.05, 0.05, (np.count_nonzero(done), 4))
+            self.steps[done] = 0
+            observations[done] = self.states[done]
+        return observations, rewards, terminated, truncated, info
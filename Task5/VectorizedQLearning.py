@@ -0,0 +1,117 @@
+import time
+
+import numpy as np
+
+
+class StateDiscretizer:
+    """
+    Maps continuous observations to q_table indices, for a single state or a whole batch at once
+    """
+
+    def __init__(self, low, high, bins):
+        # float64 so the float32 max velocity limits of the observation space do not overflow to inf
+        self.low = np.asarray(low, dtype=np.float64)
+        self.bins = bins
+        self.win_size = (np.asarray(high, dtype=np.float64) - self.low) / bins
+
+    def __call__(self, states):
+        """
+        :param states: one observation of shape (4,) or a batch of shape (N, 4)
+        :return: index tuple usable as q_table[discrete_state]
+        """
+        discrete_state = (np.asarray(states) - self.low) / self.win_size
+        discrete_state = np.clip(discrete_state, 0, self.bins - 1).astype(int)
+        return tuple(discrete_state.T)
+
+
+class VectorizedQLearner:
+    """
+    Q-learning over a VectorizedCartPole: every step all environments act epsilon-greedily
+    and all their transitions update the shared q_table at once
+    """
+
+    def __init__(self, env, q_table, discretizer, learning_rate=0.2, discount=0.95, seed=None):
+        self.env = env
+        self.q_table = q_table
+        self.discretizer = discretizer
+        self.learning_rate = learning_rate
+        self.discount = discount
+        self.rng = np.random.default_rng(seed)
+        self.epsilon = 1.0
+        self.stats = {}
+
+    def train(self, episodes, epsilon=1.0, epsilon_decay=0.99, min_epsilon=0.01, callback=None, visited=None):
+        """
+        :param episodes: number of finished episodes across all environments
+        :param epsilon: initial exploration rate, decayed once per finished episode
+        :param callback: called as callback(episode, ep_rewards) for every finished episode,
+            returning True stops training
+        :param visited: optional recorder (e.g. StateReservoir) whose add() receives the states of every step
+        :return: rewards of the finished episodes
+        """
+        n_envs = self.env.n_envs
+        n_actions = self.q_table.shape[-1]
+        q_flat = self.q_table.reshape(-1)  # view on the same data
+        self.epsilon = epsilon
+
+        states = self.env.reset()
+        discrete_states = self.discretizer(states)
+        returns = np.zeros(n_envs)
+        ep_rewards = []
+        total_steps = 0
+        stop = False
+
+        start_time = time.perf_counter()
+        while len(ep_rewards) < episodes and not stop:
+            if visited is not None:
+                visited.add(states)
+            explore = self.rng.random(n_envs) < self.epsilon
+            greedy = self.q_table[discrete_states].argmax(axis=1)
+            actions = np.where(explore, self.rng.integers(0, n_actions, n_envs), greedy)
+
+            next_states, rewards, terminated, truncated, info = self.env.step(actions)
+            done = terminated | truncated
+            returns += rewards
+            total_steps += n_envs
+
+            # finished episodes are not updated, as in the tabular loop - for the rest next_states
+            # are still the same episode
+            next_discrete_states = self.discretizer(next_states)
+            live = ~done
+            if live.any():
+                flat = np.ravel_multi_index(tuple(s[live] for s in discrete_states) + (actions[live],),
+                                            self.q_table.shape)
+                max_future_q = self.q_table[tuple(s[live] for s in next_discrete_states)].max(axis=1)
+                target = rewards[live] + self.discount * max_future_q
+                # several environments in the same (state, action) - average their targets so the
+                # update does not depend on which environment happens to be written last
+                unique, inverse = np.unique(flat, return_inverse=True)
+                target_mean = np.bincount(inverse, weights=target) / np.bincount(inverse)
+                q_flat[unique] = (1 - self.learning_rate) * q_flat[unique] + self.learning_rate * target_mean
+
+            states, discrete_states = next_states, next_discrete_states
+
+            for env_index in np.flatnonzero(done):
+                ep_rewards.append(float(returns[env_index]))
+                returns[env_index] = 0
+                if self.epsilon > min_epsilon:
+                    self.epsilon = max(min_epsilon, self.epsilon * epsilon_decay)
+                if callback is not None and callback(len(ep_rewards) - 1, ep_rewards):
+                    stop = True
+                    break
+                if len(ep_rewards) >= episodes:
+                    break
+
+        elapsed = time.perf_counter() - start_time
+        self.stats = {
+            "envs": n_envs,
+            "episodes": len(ep_rewards),
+            "steps": total_steps,
+            "seconds": elapsed,
+            "steps_per_s": total_steps / elapsed if elapsed > 0 else float("inf"),
+        }
+        return ep_rewards
+
+    def report(self):
+        print(f"Environments: {self.stats['envs']}, episodes: {self.stats['episodes']}, "
+              f"{self.stats['steps_per_s']:.0f} steps/s")